@@ -1,21 +1,40 @@
 """Bramble REST API - Flask application."""
 from flask import Flask, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_compress import Compress
+import fastjsonschema
+import hashlib
 import logging
+import orjson
+import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime
 from typing import Optional
+from werkzeug.exceptions import HTTPException
 
 from config import Config
 from serial_interface import SerialInterface
 from database import SensorDatabase
-from models import (Node, NodeMetadata, Schedule, QueuedUpdate, Zone,
+from models import (Node, NodeMetadata, Zone,
                     MAX_SCHEDULE_SLOTS, format_firmware_version)
 from valve_groups import (compute_master_windows, diff_master_slots,
                           MasterSlotOverflow)
 from auth import require_token
 
 
+# Config values read on hot request paths, bound once at import. Config is
+# immutable after startup, so this just swaps a per-call attribute-chain
+# lookup for a module-global load. Startup-only uses keep Config.* directly.
+_SERIAL_PORT = Config.SERIAL_PORT
+_MAX_RETRIES = Config.MAX_RETRIES
+_NODES_CACHE_TTL = Config.NODES_CACHE_TTL
+_HUB_QUEUE_CACHE_TTL = Config.HUB_QUEUE_CACHE_TTL
+
+
 # Setup logging
 logging.basicConfig(
     level=logging.DEBUG if Config.DEBUG else logging.INFO,
@@ -23,30 +42,225 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C encoder.
+
+    The stdlib encoder dominates CPU on the list endpoints once node counts
+    grow; orjson serializes the same payloads several times faster. Non-string
+    dict keys (device_id-keyed maps) are coerced the same way the default
+    provider does via OPT_NON_STR_KEYS.
+
+    Decoding goes through orjson as well (the POST/PUT handlers parse bodies
+    via the _json_body helper below; anything still calling
+    request.get_json() picks up the same loads).
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # The default implementation routes through dumps() and an f-string,
+        # forcing bytes -> str -> bytes on every jsonify(). Build the response
+        # body from orjson's bytes directly.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json')
+
+
+# Hub response line formats, compiled once at import. The list/queue endpoints
+# parse each line with a single C-level scan instead of a startswith() check
+# followed by a full split() — noticeably cheaper when the hub returns many
+# nodes. Trailing fields are optional for backwards compatibility with older
+# hub firmware that does not report firmware_version/valve_count.
+# NODE <addr> <device_id> <type> <online> <last_seen_sec> [<fw_version>] [<valve_count>]
+_NODE_RE = re.compile(r'^NODE (\d+) (\d+) (\S+) ([01]) (\d+)(?: (\d+))?(?: (\d+))?[ \t]*$', re.M)
+# UPDATE <seq> <type> <age_sec>
+_UPDATE_RE = re.compile(r'^UPDATE (\d+) (\S+) (\d+)', re.M)
+# QUEUE <addr> <count> (GET_QUEUE header and GET_QUEUES bulk response lines)
+_QUEUE_COUNT_RE = re.compile(r'^QUEUE (\d+) (\d+)', re.M)
+
+
+def _node_matches(lines: list):
+    """Iterate NODE matches across response lines with one joined-buffer scan.
+
+    Joining the lines once and running finditer keeps the whole parse inside
+    the regex engine — one Python-level iteration per matched node instead of
+    a match() call (plus attribute lookups and branches) per line.
+    """
+    return _NODE_RE.finditer('\n'.join(lines))
+
+
+# Constant error bodies, encoded once at import so the common 4xx/5xx paths
+# skip the per-call dict build + JSON encode. The Response object itself is
+# still constructed per request — CORS and compression mutate response headers,
+# so instances must not be shared.
+_ERR_HUB_TIMEOUT = b'{"error":"Hub did not respond"}'
+_ERR_BODY_NOT_JSON = b'{"error":"Request body must be JSON"}'
+_ERR_NOT_FOUND = b'{"error":"Endpoint not found"}'
+_ERR_INTERNAL = b'{"error":"Internal server error"}'
+
+# Empty status/metadata bodies for nodes without a DB row yet (common during
+# onboarding). Only device_id varies, so interpolate it into a pre-encoded
+# template instead of building + encoding the dict per call. device_id stays
+# quoted to preserve JS precision, matching the jsonify'd variants.
+_EMPTY_STATUS_TMPL = (
+    b'{"device_id":"%d","address":null,"battery_level":null,"error_flags":null,'
+    b'"signal_strength":null,"uptime_seconds":null,"pending_records":null,'
+    b'"updated_at":null}'
+)
+_EMPTY_METADATA_TMPL = (
+    b'{"device_id":"%d","name":null,"notes":null,"zone_id":null,"updated_at":null}'
+)
+
+
+def _error_response(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a pre-encoded constant body."""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+def _json_body():
+    """Parse the request body with orjson in one pass.
+
+    Skips request.get_json()'s content-type negotiation and cached-property
+    machinery; get_data(cache=False) also drops the raw bytes instead of
+    retaining them on the request object. Returns None for an empty or
+    unparseable body — callers treat both as 'Request body must be JSON'.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _queued_response(result, device_id: int, address: int, message: str = 'Command queued for delivery',
+                     **extra):
+    """202 envelope shared by the command-queueing POST endpoints.
+
+    Builds the common status/task_id/device_id/address fields in one place;
+    endpoint-specific fields (schedule, interval_seconds, ...) come in via
+    **extra. Route bodies stay individual — their validation, audit-log and
+    master-valve logic differ — but the response shape is defined once.
+    """
+    payload = {
+        'status': 'queued',
+        'task_id': result.id,
+        'device_id': str(device_id),  # String to preserve JS precision
+        'address': address,
+    }
+    payload.update(extra)
+    payload['message'] = message
+    return jsonify(payload), 202
+
+
+def _etag_json_response(payload: dict) -> Response:
+    """Encode a JSON response with an ETag, answering 304 on an If-None-Match hit.
+
+    Polling clients (the dashboard) receive identical payloads back-to-back;
+    on a hit the response is an empty 304 and the body bytes never leave the
+    process. flask-compress tags encoded variants as "<etag>;gzip" etc., so
+    client tags are compared with any encoding suffix stripped.
+    """
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    client_tags = {tag.split(';', 1)[0]
+                   for tag in request.if_none_match.as_set(include_weak=True)}
+    if etag in client_tags:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+
+def _node_dict(m: re.Match) -> dict:
+    """Build a node response dict straight from a _NODE_RE match.
+
+    Same shape as Node.to_dict(). Skips the dataclass + to_dict() roundtrip on
+    the read-only hot paths; the model classes stay in use where construction
+    doubles as validation (add_schedule) and on the database-fallback paths.
+    """
+    firmware_version_raw = int(m[6]) if m[6] else None
+    return {
+        'device_id': str(int(m[2])),  # String to preserve JS precision
+        'address': int(m[1]),
+        'type': m[3],
+        'online': m[4] == '1',
+        'last_seen_seconds': int(m[5]),
+        'firmware_version': (format_firmware_version(firmware_version_raw)
+                             if firmware_version_raw else None),
+        'valve_count': int(m[7]) if m[7] else None,
+    }
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
+app.json = OrjsonProvider(app)
 
 # Enable CORS for dashboard origin with credentials (needed for Cloudflare Access cookie)
 CORS(app, resources={r"/api/*": {"origins": "https://dashboard.bramble.ag"}}, supports_credentials=True)
 
-# Enable gzip compression for responses
+# Enable response compression. Below ~2KB (health checks, single-node GETs)
+# the framing overhead and CPU cost outweigh the bandwidth savings, so small
+# payloads pass through uncompressed. Algorithm choice stays with
+# flask-compress's default preference order (zstd/brotli when the client
+# accepts them, gzip otherwise); gzip level 4 is the latency/ratio sweet spot
+# on the Pi for the large sensor-data and CSV responses.
+app.config['COMPRESS_MIN_SIZE'] = 2048
+app.config['COMPRESS_LEVEL'] = 4
 Compress(app)
 
+# Largest legitimate body is a schedule-diff or batch poll of a few KB;
+# everything else is a handful of fields. Bounding the body means an abusive
+# multi-MB PUT is rejected with 413 before it is buffered or parsed.
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+
+
+# App-level error handlers so routes without special recovery logic can just
+# raise instead of carrying their own except/log/500 tail. Routes whose except
+# blocks do real work (database fallbacks, partial-failure warnings) keep them.
+@app.errorhandler(TimeoutError)
+def _handle_hub_timeout(e):
+    return _error_response(_ERR_HUB_TIMEOUT, 504)
+
+
+@app.errorhandler(Exception)
+def _handle_unexpected_error(e):
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Unhandled error handling %s", request.path)
+    return jsonify({'error': str(e)}), 500
+
 # Initialize database
 sensor_db: Optional[SensorDatabase] = None
 
 # Initialize serial interface
 serial_interface: Optional[SerialInterface] = None
 
+# Guards lazy init of the singletons above. Without it, two threads racing
+# through the None check could each open the serial port (dual readers steal
+# bytes from each other) or double-init the database. The fast path stays a
+# plain attribute check; the lock is only taken on first use.
+_init_lock = threading.Lock()
+
 
 def get_database() -> SensorDatabase:
     """Get database instance, initializing if needed."""
     global sensor_db
     if sensor_db is None:
-        sensor_db = SensorDatabase(Config.SENSOR_DB_PATH)
-        sensor_db.init_db()
-        logger.info(f"Sensor database initialized at {Config.SENSOR_DB_PATH}")
+        with _init_lock:
+            if sensor_db is None:
+                db = SensorDatabase(Config.SENSOR_DB_PATH)
+                db.init_db()
+                logger.info("Sensor database initialized at %s", Config.SENSOR_DB_PATH)
+                sensor_db = db
     return sensor_db
 
 
@@ -55,11 +269,95 @@ def get_serial() -> SerialInterface:
     global serial_interface
     if serial_interface is None:
         db = get_database()
-        serial_interface = SerialInterface(database=db)
-        serial_interface.connect()
+        with _init_lock:
+            if serial_interface is None:
+                interface = SerialInterface(database=db)
+                interface.connect()
+                serial_interface = interface
     return serial_interface
 
 
+# Small pool for overlapping independent I/O within one request (DB reads
+# alongside the serial round-trip in list_nodes, the pagination COUNT
+# alongside the page query in get_sensor_data). Sized below the gunicorn
+# thread count so fan-out can't starve request handling.
+_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fanout')
+
+_command_queue = None
+
+
+def _get_command_queue():
+    """Get the command_queue module, importing it on first use.
+
+    Importing command_queue opens the huey SQLite store as a side effect, so
+    it can't happen at module scope (tests and dev environments have no
+    /data volume). The per-handler `from command_queue import ...` form
+    re-ran the import machinery on every request; this binds the module once.
+    """
+    global _command_queue
+    if _command_queue is None:
+        with _init_lock:
+            if _command_queue is None:
+                import command_queue
+                _command_queue = command_queue
+    return _command_queue
+
+
+# Short-TTL cache of the last valid LIST_NODES response. /api/nodes,
+# /api/nodes/<id>, address resolution, and valve-count lookups all issue the
+# same hub command; under dashboard polling that multiplies serial round-trips
+# (the actual bottleneck — each one costs milliseconds to hundreds of ms and
+# blocks on the hub). A fresh-enough cached copy lets a burst share one
+# transaction. The lock also collapses concurrent fetches into a single
+# round-trip.
+_nodes_cache = {'at': 0.0, 'responses': None, 'by_device': None}
+_nodes_cache_lock = threading.Lock()
+
+
+def _list_nodes_responses(timeout: float = 2.0) -> Optional[list[str]]:
+    """Fetch a LIST_NODES response, serving a cached copy when fresh.
+
+    Returns the raw response lines (NODE_LIST header + NODE lines), or None
+    when the hub produced an invalid response. Propagates TimeoutError /
+    RuntimeError from the serial layer like send_command does. Each refresh
+    also rebuilds the parsed device_id index served by _nodes_by_device().
+    """
+    now = time.monotonic()
+    with _nodes_cache_lock:
+        if (_nodes_cache['responses'] is not None
+                and now - _nodes_cache['at'] <= _NODES_CACHE_TTL):
+            return _nodes_cache['responses']
+
+        responses = get_serial().send_command('LIST_NODES', timeout=timeout)
+        if not responses or not responses[0].startswith('NODE_LIST'):
+            return None
+        _nodes_cache['responses'] = responses
+        _nodes_cache['by_device'] = {int(m[2]): m
+                                     for m in _node_matches(responses[1:])}
+        _nodes_cache['at'] = time.monotonic()
+        return responses
+
+
+def _nodes_by_device(timeout: float = 2.0) -> Optional[dict]:
+    """NODE matches keyed by device_id, parsed once per cache refresh.
+
+    Address resolution and valve-count lookups were each rescanning the raw
+    lines on every call; this turns them into a dict lookup against an index
+    built a single time when the cache refreshes.
+    """
+    if _list_nodes_responses(timeout=timeout) is None:
+        return None
+    with _nodes_cache_lock:
+        return _nodes_cache['by_device']
+
+
+def _invalidate_nodes_cache() -> None:
+    """Drop the cached LIST_NODES response (e.g. after deleting a node)."""
+    with _nodes_cache_lock:
+        _nodes_cache['responses'] = None
+        _nodes_cache['by_device'] = None
+
+
 def _link_status() -> dict:
     """Best-effort serial link status; never raises.
 
@@ -75,6 +373,14 @@ def _link_status() -> dict:
         return down
 
 
+# Encoded bodies for the two most-polled debug endpoints, reused within
+# their own resolution window (health keys on the link snapshot, time on the
+# whole second). The Response itself is rebuilt per call — see the note on
+# the pre-encoded error bodies above.
+_health_cache: tuple[Optional[tuple], bytes, int] = (None, b'', 200)
+_time_cache: tuple[int, bytes] = (0, b'')
+
+
 @app.route('/api/health', methods=['GET'])
 @app.route('/healthz', methods=['GET'])
 def health():
@@ -83,54 +389,193 @@ def health():
     Returns 503 (not 200) when the serial link to the hub is down or stale, so
     a dead link surfaces instead of being masked behind stale data.
     """
+    global _health_cache
     link = _link_status()
-    if link['healthy']:
-        status = 'healthy'
-    elif link['connected']:
-        status = 'degraded'
-    else:
-        status = 'down'
-    payload = {
-        'status': status,
-        'serial_connected': link['connected'],
-        'serial_link_up': link['healthy'],
-        'last_sync_age_seconds': link['last_rx_age_seconds'],
-        'serial_port': Config.SERIAL_PORT,
-    }
-    return jsonify(payload), (200 if link['healthy'] else 503)
+    key = (link['connected'], link['healthy'], link['last_rx_age_seconds'])
+    cached_key, body, http_status = _health_cache
+    if key != cached_key:
+        if link['healthy']:
+            status = 'healthy'
+        elif link['connected']:
+            status = 'degraded'
+        else:
+            status = 'down'
+        body = orjson.dumps({
+            'status': status,
+            'serial_connected': link['connected'],
+            'serial_link_up': link['healthy'],
+            'last_sync_age_seconds': link['last_rx_age_seconds'],
+            'serial_port': _SERIAL_PORT,
+        })
+        http_status = 200 if link['healthy'] else 503
+        _health_cache = (key, body, http_status)
+    response = app.response_class(body, status=http_status, mimetype='application/json')
+    # Liveness must never be served stale by an intermediary.
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 
 @app.route('/api/system/time', methods=['GET'])
 def system_time():
     """Get current system time (for debugging)."""
-    from datetime import datetime
-    now = datetime.now()
-    weekday = (now.weekday() + 1) % 7  # Convert to hub format (0=Sunday)
+    global _time_cache
+    ts = time.time()
+    now_second = int(ts)
+    cached_second, body = _time_cache
+    if now_second != cached_second:
+        local = time.localtime(ts)
+        weekday = (local.tm_wday + 1) % 7  # Convert to hub format (0=Sunday)
+        body = orjson.dumps({
+            'datetime': datetime.fromtimestamp(now_second).isoformat(),
+            'formatted': time.strftime('%Y-%m-%d %H:%M:%S', local),
+            'weekday': weekday,
+            'timestamp': now_second,
+        })
+        _time_cache = (now_second, body)
+    response = app.response_class(body, mimetype='application/json')
+    # The payload has one-second resolution, so intermediaries and browsers
+    # may reuse it for that long instead of re-polling.
+    response.headers['Cache-Control'] = 'public, max-age=1'
+    return response
+
+
+_BATCH_MAX_REQUESTS = 50
+
+
+@app.route('/api/batch', methods=['POST'])
+def batch():
+    """Dispatch several GET sub-requests in one HTTP round-trip.
+
+    The dashboard fans out to per-node status/metadata/sensor-data endpoints;
+    for N nodes that is 4N HTTP requests each paying WSGI, CORS, and gzip
+    overhead. This endpoint accepts a list of sub-requests and dispatches
+    them internally, so one round-trip covers the whole poll and every
+    sub-call shares the same fresh LIST_NODES cache window.
+
+    Request body:
+        { "requests": [ {"id": "n1-status", "url": "/api/nodes/42"}, ... ] }
+
+    Returns:
+        { "<id>": {"status": 200, "body": {...}}, ... }
+
+    Only GET sub-requests are allowed — mutations must go through their own
+    endpoints (and their auth decorators) directly.
+    """
+    data = _json_body()
+    if not data or not isinstance(data.get('requests'), list):
+        return jsonify({'error': "Request body must include a 'requests' list"}), 400
+    sub_requests = data['requests']
+    if len(sub_requests) > _BATCH_MAX_REQUESTS:
+        return jsonify({'error': f'At most {_BATCH_MAX_REQUESTS} sub-requests per batch'}), 400
+
+    adapter = app.url_map.bind('')
+    results = {}
+    for entry in sub_requests:
+        if not isinstance(entry, dict):
+            return jsonify({'error': 'Each sub-request must be an object'}), 400
+        url = entry.get('url', '')
+        sub_id = entry.get('id') or url
+        method = str(entry.get('method', 'GET')).upper()
+        if method != 'GET':
+            results[sub_id] = {'status': 405,
+                               'body': {'error': 'Only GET sub-requests are supported'}}
+            continue
+        try:
+            endpoint, view_args = adapter.match(url.split('?', 1)[0], method='GET')
+        except HTTPException as e:
+            results[sub_id] = {'status': e.code, 'body': {'error': e.description}}
+            continue
+        try:
+            with app.test_request_context(url):
+                response = app.make_response(app.view_functions[endpoint](**view_args))
+            results[sub_id] = {'status': response.status_code,
+                               'body': response.get_json(silent=True)}
+        except Exception as e:
+            logger.error("Batch sub-request %s failed: %s", url, e)
+            results[sub_id] = {'status': 500, 'body': {'error': str(e)}}
+
+    return jsonify(results)
 
-    return jsonify({
-        'datetime': now.isoformat(),
-        'formatted': now.strftime('%Y-%m-%d %H:%M:%S'),
-        'weekday': weekday,
-        'timestamp': int(now.timestamp())
-    })
 
+# GET_QUEUE single-flight + short TTL cache. Polling dashboards issue the same
+# per-node queue query at a fixed interval; identical concurrent requests now
+# await one hub round-trip instead of each paying their own, and bursts reuse
+# the response for HUB_QUEUE_CACHE_TTL seconds.
+_queue_cache: dict[int, tuple[float, list[str]]] = {}
+_queue_inflight: dict[int, Future] = {}
+_queue_lock = threading.Lock()
 
-def _get_hub_queue_count(serial: SerialInterface, address: int) -> Optional[int]:
+
+def _get_queue_responses(address: int, timeout: float = Config.COMMAND_TIMEOUT) -> list[str]:
+    """Send GET_QUEUE for one node, deduplicating concurrent callers.
+
+    The first caller for an address performs the serial round-trip; concurrent
+    duplicates block on its Future and share the result. Responses are served
+    from a short TTL cache while fresh. Raises TimeoutError / RuntimeError
+    like send_command.
+    """
+    now = time.monotonic()
+    with _queue_lock:
+        cached = _queue_cache.get(address)
+        if cached and now - cached[0] <= _HUB_QUEUE_CACHE_TTL:
+            return cached[1]
+        future = _queue_inflight.get(address)
+        if future is not None:
+            owner = False
+        else:
+            future = Future()
+            _queue_inflight[address] = future
+            owner = True
+
+    if not owner:
+        return future.result(timeout=timeout + 1.0)
+
+    try:
+        responses = get_serial().send_command(f'GET_QUEUE {address}', timeout=timeout)
+    except BaseException as e:
+        with _queue_lock:
+            _queue_inflight.pop(address, None)
+        future.set_exception(e)
+        raise
+    with _queue_lock:
+        _queue_cache[address] = (time.monotonic(), responses)
+        _queue_inflight.pop(address, None)
+    future.set_result(responses)
+    return responses
+
+
+def _get_all_queue_counts() -> Optional[dict[int, int]]:
+    """All per-node hub queue counts in one GET_QUEUES round-trip.
+
+    Returns {address: pending_count}, or None when the hub does not support
+    GET_QUEUES (older firmware answers ERROR) or the link is down — callers
+    fall back to per-node GET_QUEUE.
+    """
+    try:
+        responses = get_serial().send_command('GET_QUEUES', timeout=2.0)
+    except (TimeoutError, RuntimeError):
+        return None
+    if not responses or not responses[0].startswith('QUEUES'):
+        return None
+    return {int(m[1]): int(m[2])
+            for m in _QUEUE_COUNT_RE.finditer('\n'.join(responses[1:]))}
+
+
+def _get_hub_queue_count(address: int) -> Optional[int]:
     """Get the hub queue count for a node.
 
     Args:
-        serial: Serial interface to hub
         address: Node address
 
     Returns:
         Queue count or None if unavailable
     """
     try:
-        responses = serial.send_command(f'GET_QUEUE {address}', timeout=1.0)
-        if responses and responses[0].startswith('QUEUE'):
-            parts = responses[0].split()
-            if len(parts) >= 3:
-                return int(parts[2])
+        responses = _get_queue_responses(address, timeout=1.0)
+        if responses:
+            m = _QUEUE_COUNT_RE.match(responses[0])
+            if m:
+                return int(m[2])
     except Exception:
         pass
     return None
@@ -165,14 +610,10 @@ def _build_nodes_from_database():
     nodes = []
 
     # Look up node_type from nodes table (node_status doesn't store it)
-    all_nodes_info = {}
     try:
-        with db._get_connection() as conn:
-            rows = conn.execute("SELECT device_id, node_type FROM nodes").fetchall()
-            for row in rows:
-                all_nodes_info[row[0]] = row[1]
+        all_nodes_info = db.get_node_types()
     except Exception:
-        pass
+        all_nodes_info = {}
 
     for device_id, status in all_status.items():
         updated_at = status.get('updated_at', 0)
@@ -211,16 +652,13 @@ def _resolve_node_address(device_id: int) -> Optional[int]:
     Returns the address or None if the node cannot be found.
     """
     try:
-        serial = get_serial()
-        responses = serial.send_command('LIST_NODES', timeout=2.0)
-        if responses and responses[0].startswith('NODE_LIST'):
-            for line in responses[1:]:
-                if line.startswith('NODE '):
-                    parts = line.split()
-                    if len(parts) >= 6 and int(parts[2]) == device_id:
-                        return int(parts[1])
+        nodes = _nodes_by_device(timeout=2.0)
+        if nodes:
+            m = nodes.get(device_id)
+            if m:
+                return int(m[1])
     except Exception as e:
-        logger.warning(f"Hub lookup failed for device_id {device_id}: {e}")
+        logger.warning("Hub lookup failed for device_id %s: %s", device_id, e)
 
     try:
         db = get_database()
@@ -228,7 +666,7 @@ def _resolve_node_address(device_id: int) -> Optional[int]:
         if node_info and node_info.get('address'):
             return node_info['address']
     except Exception as e:
-        logger.warning(f"Database lookup failed for device_id {device_id}: {e}")
+        logger.warning("Database lookup failed for device_id %s: %s", device_id, e)
 
     return None
 
@@ -245,25 +683,22 @@ def _node_valve_count(device_id: int) -> int:
     finally to LEGACY_VALVE_COUNT when the count is unknown.
     """
     try:
-        serial = get_serial()
-        responses = serial.send_command('LIST_NODES', timeout=2.0)
-        if responses and responses[0].startswith('NODE_LIST'):
-            for line in responses[1:]:
-                if line.startswith('NODE '):
-                    parts = line.split()
-                    if len(parts) >= 8 and int(parts[2]) == device_id:
-                        count = int(parts[7])
-                        if count > 0:
-                            return count
+        nodes = _nodes_by_device(timeout=2.0)
+        if nodes:
+            m = nodes.get(device_id)
+            if m and m[7]:
+                count = int(m[7])
+                if count > 0:
+                    return count
     except Exception as e:
-        logger.warning(f"Hub valve-count lookup failed for device_id {device_id}: {e}")
+        logger.warning("Hub valve-count lookup failed for device_id %s: %s", device_id, e)
 
     try:
         node_info = get_database().get_node_by_device_id(device_id)
         if node_info and node_info.get('valve_count'):
             return node_info['valve_count']
     except Exception as e:
-        logger.warning(f"DB valve-count lookup failed for device_id {device_id}: {e}")
+        logger.warning("DB valve-count lookup failed for device_id %s: %s", device_id, e)
 
     return LEGACY_VALVE_COUNT
 
@@ -301,7 +736,7 @@ def _apply_master_diff(db, group, force=False):
     slot is re-sent regardless of the diff (used by /resync to recover from a
     TTL-expired command). Returns a summary dict. Raises MasterSlotOverflow.
     """
-    from command_queue import queue_schedule_diff, COMMAND_TTL_DEFAULTS
+    cq = _get_command_queue()
     master_device_id = int(group['master_device_id'])
     master_valve = group['master_valve']
     master_address = _resolve_node_address(master_device_id)
@@ -316,8 +751,8 @@ def _apply_master_diff(db, group, force=False):
     if master_address is None:
         # Persist intent so a later /resync (once the master is reachable) syncs.
         db.replace_master_slots(group['id'], master_device_id, diff['slots'])
-        logger.warning(f"Master device {master_device_id} address unknown; "
-                       f"stored slots but skipped queueing")
+        logger.warning("Master device %s address unknown; "
+                       "stored slots but skipped queueing", master_device_id)
         return {'set': 0, 'removed': 0, 'master_unreachable': True}
 
     # Audit rows for every op. The apply below sends all REMOVEs before any SET
@@ -329,7 +764,7 @@ def _apply_master_diff(db, group, force=False):
         cmd_ids.append(db.insert_command(
             device_id=master_device_id, command_type='schedule_remove',
             params={'index': index, 'mirrored_from_group': group['id']},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['schedule_remove']))
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['schedule_remove']))
     for slot in diff['to_set']:
         cmd_ids.append(db.insert_command(
             device_id=master_device_id, command_type='schedule_set',
@@ -337,7 +772,7 @@ def _apply_master_diff(db, group, force=False):
                     'minute': slot['minute'], 'duration': slot['duration'],
                     'days': slot['days'], 'valve': master_valve,
                     'mirrored_from_group': group['id']},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['schedule_set']))
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['schedule_set']))
 
     if diff['to_remove'] or diff['to_set']:
         sets_payload = [
@@ -345,7 +780,7 @@ def _apply_master_diff(db, group, force=False):
              'minute': slot['minute'], 'duration': slot['duration'],
              'days': slot['days'], 'valve': master_valve}
             for slot in diff['to_set']]
-        result = queue_schedule_diff(master_address, diff['to_remove'], sets_payload)
+        result = cq.queue_schedule_diff(master_address, diff['to_remove'], sets_payload)
         # All ops ride one batch task, so they share its huey id.
         for cmd_id in cmd_ids:
             if cmd_id is not None:
@@ -359,7 +794,7 @@ def _apply_master_diff(db, group, force=False):
 def _teardown_master_slots(db, group):
     """Queue REMOVE_SCHEDULE for every master slot the API owns for this group
     and clear them. Used before re-homing or deleting a group."""
-    from command_queue import queue_remove_schedule, COMMAND_TTL_DEFAULTS
+    cq = _get_command_queue()
     master_device_id = int(group['master_device_id'])
     master_address = _resolve_node_address(master_device_id)
     owned = [s for s in db.list_master_slots(master_device_id)
@@ -370,8 +805,8 @@ def _teardown_master_slots(db, group):
                 device_id=master_device_id, command_type='schedule_remove',
                 params={'index': slot['master_index'],
                         'mirrored_from_group': group['id']},
-                ttl_seconds=COMMAND_TTL_DEFAULTS['schedule_remove'])
-            result = queue_remove_schedule(node_address=master_address,
+                ttl_seconds=cq.COMMAND_TTL_DEFAULTS['schedule_remove'])
+            result = cq.queue_remove_schedule(node_address=master_address,
                                            index=slot['master_index'])
             if cmd_id is not None:
                 db.set_command_huey_task(cmd_id, result.id)
@@ -380,13 +815,13 @@ def _teardown_master_slots(db, group):
 
 def _queue_master_actuator(db, group, command, duration_seconds=0):
     """Mirror a manual valve run/stop onto the group's master valve."""
-    from command_queue import queue_send_actuator, COMMAND_TTL_DEFAULTS
+    cq = _get_command_queue()
     master_device_id = int(group['master_device_id'])
     master_valve = group['master_valve']
     master_address = _resolve_node_address(master_device_id)
     if master_address is None:
-        logger.warning(f"Master device {master_device_id} address unknown; "
-                       f"skipping mirror actuator")
+        logger.warning("Master device %s address unknown; "
+                       "skipping mirror actuator", master_device_id)
         return
     cmd_type = 'valve_open' if command == 1 else 'valve_close'
     params = {'valve': master_valve, 'mirrored_from_group': group['id']}
@@ -394,8 +829,8 @@ def _queue_master_actuator(db, group, command, duration_seconds=0):
         params['duration_seconds'] = duration_seconds
     cmd_id = db.insert_command(device_id=master_device_id, command_type=cmd_type,
                                params=params,
-                               ttl_seconds=COMMAND_TTL_DEFAULTS[cmd_type])
-    result = queue_send_actuator(node_address=master_address, actuator_type=1,
+                               ttl_seconds=cq.COMMAND_TTL_DEFAULTS[cmd_type])
+    result = cq.queue_send_actuator(node_address=master_address, actuator_type=1,
                                  command=command, param=master_valve,
                                  duration_seconds=duration_seconds)
     if cmd_id is not None:
@@ -413,81 +848,77 @@ def list_nodes():
         JSON array of node objects with metadata if available
     """
     try:
-        serial = get_serial()
+        # Kick off the metadata/status/valve lookups while the serial
+        # round-trip below is in flight — they are independent, so the wall
+        # time is max(serial, db) instead of the sum.
+        db = get_database()
+        future_metadata = _pool.submit(db.get_all_node_metadata)
+        future_status = _pool.submit(db.get_all_node_status)
+        future_valves = _pool.submit(db.get_all_valve_metadata)
 
         # Retry LIST_NODES up to 3 times — the hub may not respond on the first
         # attempt if it is busy with LoRa operations or if UART bytes are lost.
         responses = None
-        for attempt in range(Config.MAX_RETRIES):
+        for attempt in range(_MAX_RETRIES):
             try:
-                responses = serial.send_command('LIST_NODES', timeout=2.0)
-                if responses and responses[0].startswith('NODE_LIST'):
+                responses = _list_nodes_responses(timeout=2.0)
+                if responses:
                     break
-                logger.warning(f"LIST_NODES attempt {attempt + 1}: invalid response {responses}")
-                responses = None
+                logger.warning("LIST_NODES attempt %s: invalid response", attempt + 1)
             except TimeoutError:
-                logger.warning(f"LIST_NODES attempt {attempt + 1}/{Config.MAX_RETRIES} timed out")
+                logger.warning("LIST_NODES attempt %s/%s timed out", attempt + 1, _MAX_RETRIES)
 
-        if not responses or not responses[0].startswith('NODE_LIST'):
+        if not responses:
             logger.warning("LIST_NODES failed after retries, falling back to database")
             return _build_nodes_from_database()
 
         header = responses[0].split()
         count = int(header[1])
 
-        # Get all metadata and status to include with nodes (keyed by device_id)
-        db = get_database()
-        all_metadata = db.get_all_node_metadata()
-        all_status = db.get_all_node_status()
-        all_valve_metadata = db.get_all_valve_metadata()
+        # Collect the overlapped lookups (keyed by device_id)
+        all_metadata = future_metadata.result()
+        all_status = future_status.result()
+        all_valve_metadata = future_valves.result()
 
-        # Check if we should include queue counts
+        # Check if we should include queue counts. Prefer the bulk GET_QUEUES
+        # query (one round-trip for all nodes); fall back to per-node
+        # GET_QUEUE on older hub firmware.
         include_queue = request.args.get('include_queue', '').lower() == 'true'
+        queue_counts = _get_all_queue_counts() if include_queue else None
 
         nodes = []
-        for line in responses[1:]:
-            if line.startswith('NODE '):
-                parts = line.split()
-                if len(parts) >= 6:
-                    device_id = int(parts[2])
-                    address = int(parts[1])
-                    # Skip nodes without device_id (shouldn't happen normally)
-                    if device_id == 0:
-                        continue
-                    # firmware_version and valve_count are optional (backwards compatibility)
-                    firmware_version_raw = int(parts[6]) if len(parts) >= 7 else None
-                    valve_count = int(parts[7]) if len(parts) >= 8 else None
-                    node = Node(
-                        device_id=device_id,
-                        address=address,
-                        node_type=parts[3],
-                        online=parts[4] == '1',
-                        last_seen_seconds=int(parts[5]),
-                        firmware_version=format_firmware_version(firmware_version_raw) if firmware_version_raw else None,
-                        valve_count=valve_count
-                    )
-                    # Persist a known valve_count so the DB-fallback path can report it
-                    if valve_count is not None:
-                        try:
-                            get_database().set_node_valve_count(device_id, valve_count)
-                        except Exception as e:
-                            logger.warning(f"Could not persist valve_count for {device_id}: {e}")
-                    node_dict = node.to_dict()
-                    # Include metadata if available (keyed by device_id)
-                    if device_id in all_metadata:
-                        node_dict['metadata'] = all_metadata[device_id]
-                    # Include status if available (keyed by device_id)
-                    if device_id in all_status:
-                        node_dict['status'] = all_status[device_id]
-                    # Include per-valve friendly names ({"<index>": name})
-                    node_dict['valves'] = _valve_names_map(all_valve_metadata, device_id)
-                    # Include hub queue count if requested (uses address for hub routing)
-                    if include_queue:
-                        node_dict['hub_queue_count'] = _get_hub_queue_count(serial, address)
-                    nodes.append(node_dict)
+        for m in _node_matches(responses[1:]):
+            device_id = int(m[2])
+            address = int(m[1])
+            # Skip nodes without device_id (shouldn't happen normally)
+            if device_id == 0:
+                continue
+            node_dict = _node_dict(m)
+            valve_count = node_dict['valve_count']
+            # Persist a known valve_count so the DB-fallback path can report it
+            if valve_count is not None:
+                try:
+                    db.set_node_valve_count(device_id, valve_count)
+                except Exception as e:
+                    logger.warning("Could not persist valve_count for %s: %s", device_id, e)
+            # Include metadata if available (keyed by device_id)
+            if device_id in all_metadata:
+                node_dict['metadata'] = all_metadata[device_id]
+            # Include status if available (keyed by device_id)
+            if device_id in all_status:
+                node_dict['status'] = all_status[device_id]
+            # Include per-valve friendly names ({"<index>": name})
+            node_dict['valves'] = _valve_names_map(all_valve_metadata, device_id)
+            # Include hub queue count if requested (uses address for hub routing)
+            if include_queue:
+                if queue_counts is not None:
+                    node_dict['hub_queue_count'] = queue_counts.get(address, 0)
+                else:
+                    node_dict['hub_queue_count'] = _get_hub_queue_count(address)
+            nodes.append(node_dict)
 
         link = _link_status()
-        return jsonify({
+        return _etag_json_response({
             'count': count,
             'nodes': nodes,
             'source': 'hub',
@@ -496,7 +927,7 @@ def list_nodes():
         })
 
     except Exception as e:
-        logger.error(f"Error listing nodes: {e}")
+        logger.error("Error listing nodes: %s", e)
         return _build_nodes_from_database()
 
 
@@ -511,45 +942,32 @@ def get_node(device_id: int):
         JSON node object
     """
     try:
-        serial = get_serial()
-        responses = serial.send_command('LIST_NODES')
+        responses = _list_nodes_responses()
 
         # Parse and find the node by device_id
         # Format: NODE <addr> <device_id> <type> <online> <last_seen_sec> [<firmware_version>] [<valve_count>]
-        if responses and responses[0].startswith('NODE_LIST'):
-            for line in responses[1:]:
-                if line.startswith('NODE '):
-                    parts = line.split()
-                    if len(parts) >= 6 and int(parts[2]) == device_id:
-                        address = int(parts[1])
-                        firmware_version_raw = int(parts[6]) if len(parts) >= 7 else None
-                        valve_count = int(parts[7]) if len(parts) >= 8 else None
-                        node = Node(
-                            device_id=device_id,
-                            address=address,
-                            node_type=parts[3],
-                            online=parts[4] == '1',
-                            last_seen_seconds=int(parts[5]),
-                            firmware_version=format_firmware_version(firmware_version_raw) if firmware_version_raw else None,
-                            valve_count=valve_count
-                        )
-                        if valve_count is not None:
-                            try:
-                                get_database().set_node_valve_count(device_id, valve_count)
-                            except Exception as e:
-                                logger.warning(f"Could not persist valve_count for {device_id}: {e}")
-                        return jsonify(node.to_dict())
+        if responses:
+            m = (_nodes_by_device() or {}).get(device_id)
+            if m:
+                node_dict = _node_dict(m)
+                valve_count = node_dict['valve_count']
+                if valve_count is not None:
+                    try:
+                        get_database().set_node_valve_count(device_id, valve_count)
+                    except Exception as e:
+                        logger.warning("Could not persist valve_count for %s: %s", device_id, e)
+                return jsonify(node_dict)
 
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
         # Invalid response — fall through to database fallback
-        logger.warning(f"Invalid LIST_NODES response for get_node, falling back to database")
+        logger.warning("Invalid LIST_NODES response for get_node, falling back to database")
 
     except (TimeoutError, RuntimeError):
-        logger.warning(f"Hub unavailable for get_node({device_id}), falling back to database")
+        logger.warning("Hub unavailable for get_node(%s), falling back to database", device_id)
 
     except Exception as e:
-        logger.error(f"Error getting node {device_id}: {e}")
+        logger.error("Error getting node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
     # Database fallback
@@ -580,7 +998,7 @@ def get_node(device_id: int):
         )
         return jsonify(node.to_dict())
     except Exception as e:
-        logger.error(f"Database fallback failed for node {device_id}: {e}")
+        logger.error("Database fallback failed for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -614,16 +1032,13 @@ def delete_node(device_id: int):
         # If not in database, try to find address from hub's LIST_NODES
         if address is None:
             try:
-                responses = serial.send_command('LIST_NODES')
-                for line in responses[1:]:
-                    if line.startswith('NODE '):
-                        parts = line.split()
-                        if len(parts) >= 3 and int(parts[2]) == device_id:
-                            address = int(parts[1])
-                            logger.info(f"Found node {device_id} address {address} from hub")
-                            break
+                nodes = _nodes_by_device() or {}
+                m = nodes.get(device_id)
+                if m:
+                    address = int(m[1])
+                    logger.info("Found node %s address %s from hub", device_id, address)
             except Exception as e:
-                logger.warning(f"Could not query hub for node address: {e}")
+                logger.warning("Could not query hub for node address: %s", e)
 
         # Try to tell the hub to delete the node from its registry
         hub_deleted = False
@@ -634,19 +1049,21 @@ def delete_node(device_id: int):
                 if responses:
                     if responses[0].startswith('DELETED_NODE'):
                         hub_deleted = True
-                        logger.info(f"Hub deleted node {address} from registry")
+                        _invalidate_nodes_cache()
+                        logger.info("Hub deleted node %s from registry", address)
                     elif responses[0].startswith('ERROR'):
                         hub_error = responses[0]
-                        logger.warning(f"Hub error deleting node {address}: {hub_error}")
+                        logger.warning("Hub error deleting node %s: %s", address, hub_error)
             except Exception as e:
                 hub_error = str(e)
-                logger.warning(f"Could not send DELETE_NODE to hub: {e}")
+                logger.warning("Could not send DELETE_NODE to hub: %s", e)
 
         # Delete from database regardless of hub result
         db_deleted = db.delete_node(device_id)
 
         if db_deleted or hub_deleted:
-            logger.info(f"Deleted node device_id={device_id} (hub={hub_deleted}, db={db_deleted})")
+            logger.info("Deleted node device_id=%s (hub=%s, db=%s)",
+                        device_id, hub_deleted, db_deleted)
             return jsonify({
                 'message': f'Node {device_id} deleted',
                 'hub_deleted': hub_deleted,
@@ -656,7 +1073,7 @@ def delete_node(device_id: int):
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
     except Exception as e:
-        logger.error(f"Error deleting node {device_id}: {e}")
+        logger.error("Error deleting node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -675,22 +1092,14 @@ def get_node_status(device_id: int):
         status = db.get_node_status(device_id)
 
         if status:
-            return jsonify(status)
+            return _etag_json_response(status)
         else:
             # Return empty status structure for nodes without status
-            return jsonify({
-                'device_id': str(device_id),  # String to preserve JS precision
-                'address': None,
-                'battery_level': None,
-                'error_flags': None,
-                'signal_strength': None,
-                'uptime_seconds': None,
-                'pending_records': None,
-                'updated_at': None
-            })
+            return app.response_class(_EMPTY_STATUS_TMPL % device_id,
+                                      mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error getting status for node {device_id}: {e}")
+        logger.error("Error getting status for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -733,7 +1142,7 @@ def get_node_error_history(device_id: int):
         })
 
     except Exception as e:
-        logger.error(f"Error getting error history for node {device_id}: {e}")
+        logger.error("Error getting error history for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -752,19 +1161,14 @@ def get_node_metadata(device_id: int):
         metadata = db.get_node_metadata(device_id)
 
         if metadata:
-            return jsonify(metadata)
+            return _etag_json_response(metadata)
         else:
             # Return empty metadata structure for nodes without metadata
-            return jsonify({
-                'device_id': str(device_id),  # String to preserve JS precision
-                'name': None,
-                'notes': None,
-                'zone_id': None,
-                'updated_at': None
-            })
+            return app.response_class(_EMPTY_METADATA_TMPL % device_id,
+                                      mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error getting metadata for node {device_id}: {e}")
+        logger.error("Error getting metadata for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -785,9 +1189,9 @@ def update_node_metadata(device_id: int):
         JSON updated metadata object
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         db = get_database()
         metadata = db.update_node_metadata(
@@ -799,7 +1203,7 @@ def update_node_metadata(device_id: int):
         return jsonify(metadata)
 
     except Exception as e:
-        logger.error(f"Error updating metadata for node {device_id}: {e}")
+        logger.error("Error updating metadata for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -820,7 +1224,8 @@ def get_valve_metadata(device_id: int, valve_id: int):
             'updated_at': None,
         })
     except Exception as e:
-        logger.error(f"Error getting valve metadata for node {device_id} valve {valve_id}: {e}")
+        logger.error("Error getting valve metadata for node %s valve %s: %s",
+                     device_id, valve_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -836,9 +1241,9 @@ def update_valve_metadata(device_id: int, valve_id: int):
         { "name": "North Bed" }
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         # Validate the valve index against the node's valve count (live from the
         # hub, falling back to the DB) so names can't be set for valves that
@@ -855,7 +1260,8 @@ def update_valve_metadata(device_id: int, valve_id: int):
         return jsonify(metadata)
 
     except Exception as e:
-        logger.error(f"Error updating valve metadata for node {device_id} valve {valve_id}: {e}")
+        logger.error("Error updating valve metadata for node %s valve %s: %s",
+                     device_id, valve_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -873,8 +1279,7 @@ def get_queue(device_id: int):
         address = _resolve_node_address(device_id)
         if address is None:
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
-        serial = get_serial()
-        responses = serial.send_command(f'GET_QUEUE {address}')
+        responses = _get_queue_responses(address)
 
         # Parse response
         # Format: QUEUE <addr> <count>
@@ -882,25 +1287,18 @@ def get_queue(device_id: int):
         if not responses or not responses[0].startswith('QUEUE'):
             return jsonify({'error': 'Invalid response from hub'}), 500
 
-        header = responses[0].split()
-        if len(header) < 3:
+        header = _QUEUE_COUNT_RE.match(responses[0])
+        if not header:
             return jsonify({'error': 'Invalid queue response format'}), 500
 
         count = int(header[2])
 
-        updates = []
-        for line in responses[1:]:
-            if line.startswith('UPDATE '):
-                parts = line.split()
-                if len(parts) >= 4:
-                    update = QueuedUpdate(
-                        sequence=int(parts[1]),
-                        update_type=parts[2],
-                        age_seconds=int(parts[3])
-                    )
-                    updates.append(update.to_dict())
+        updates = [
+            {'sequence': int(m[1]), 'type': m[2], 'age_seconds': int(m[3])}
+            for m in _UPDATE_RE.finditer('\n'.join(responses[1:]))
+        ]
 
-        return jsonify({
+        return _etag_json_response({
             'device_id': str(device_id),  # String to preserve JS precision
             'address': address,
             'count': count,
@@ -908,12 +1306,30 @@ def get_queue(device_id: int):
         })
 
     except TimeoutError:
-        return jsonify({'error': 'Hub did not respond'}), 504
+        return _error_response(_ERR_HUB_TIMEOUT, 504)
     except Exception as e:
-        logger.error(f"Error getting queue for node {device_id}: {e}")
+        logger.error("Error getting queue for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
+# POST-body validator, compiled once at import. fastjsonschema generates a
+# specialized validator function per schema, so per-request validation is one
+# call instead of a chain of field plucks and range checks. Ranges mirror
+# Schedule.validate() in models.py (the PMU-side limits).
+_validate_schedule_body = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['index', 'hour', 'minute', 'duration', 'days', 'valve'],
+    'properties': {
+        'index': {'type': 'integer', 'minimum': 0, 'maximum': MAX_SCHEDULE_SLOTS - 1},
+        'hour': {'type': 'integer', 'minimum': 0, 'maximum': 23},
+        'minute': {'type': 'integer', 'minimum': 0, 'maximum': 59},
+        'duration': {'type': 'integer', 'minimum': 0, 'maximum': 65535},
+        'days': {'type': 'integer', 'minimum': 0, 'maximum': 127},
+        'valve': {'type': 'integer', 'minimum': 0},
+    },
+})
+
+
 @app.route('/api/nodes/<int:device_id>/schedules', methods=['POST'])
 def add_schedule(device_id: int):
     """Add or update a schedule entry for a node.
@@ -941,27 +1357,15 @@ def add_schedule(device_id: int):
 
         db = get_database()
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
-        # Create and validate schedule
+        # Validate shape and ranges against the compiled schema
         try:
-            schedule = Schedule(
-                index=data['index'],
-                hour=data['hour'],
-                minute=data['minute'],
-                duration=data['duration'],
-                days=data['days'],
-                valve=data['valve']
-            )
-        except KeyError as e:
-            return jsonify({'error': f'Missing required field: {e}'}), 400
-
-        # Validate
-        errors = schedule.validate()
-        if errors:
-            return jsonify({'error': 'Validation failed', 'details': errors}), 400
+            _validate_schedule_body(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return jsonify({'error': 'Validation failed', 'details': [e.message]}), 400
 
         # If this zone valve belongs to a master-valve group, confirm the
         # resulting master schedule set still fits BEFORE persisting anything
@@ -993,7 +1397,7 @@ def add_schedule(device_id: int):
 
         # Record in the node_commands audit log so the dashboard's Recent
         # Activity shows a pending row immediately (mirrors valve_open flow).
-        from command_queue import queue_set_schedule, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
 
         command_id = db.insert_command(
             device_id=device_id,
@@ -1006,10 +1410,10 @@ def add_schedule(device_id: int):
                 'days': data['days'],
                 'valve': data['valve'],
             },
-            ttl_seconds=COMMAND_TTL_DEFAULTS['schedule_set'],
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['schedule_set'],
         )
 
-        result = queue_set_schedule(
+        result = cq.queue_set_schedule(
             node_address=address,
             index=data['index'],
             hour=data['hour'],
@@ -1026,18 +1430,11 @@ def add_schedule(device_id: int):
         if group:
             _apply_master_diff(db, group)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'command_id': command_id,
-            'device_id': str(device_id),  # String to preserve JS precision
-            'address': address,
-            'schedule': data,
-            'message': 'Command queued for delivery'
-        }), 202
+        return _queued_response(result, device_id, address,
+                                command_id=command_id, schedule=data)
 
     except Exception as e:
-        logger.error(f"Error adding schedule for node {device_id}: {e}")
+        logger.error("Error adding schedule for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1072,16 +1469,16 @@ def remove_schedule(device_id: int, index: int):
 
         # Record in the node_commands audit log so the dashboard's Recent
         # Activity shows a pending row immediately (mirrors valve_open flow).
-        from command_queue import queue_remove_schedule, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
 
         command_id = db.insert_command(
             device_id=device_id,
             command_type='schedule_remove',
             params={'index': index},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['schedule_remove'],
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['schedule_remove'],
         )
 
-        result = queue_remove_schedule(node_address=address, index=index)
+        result = cq.queue_remove_schedule(node_address=address, index=index)
 
         if command_id is not None:
             db.set_command_huey_task(command_id, result.id)
@@ -1092,18 +1489,11 @@ def remove_schedule(device_id: int, index: int):
             if group:
                 _apply_master_diff(db, group)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'command_id': command_id,
-            'device_id': str(device_id),  # String to preserve JS precision
-            'address': address,
-            'schedule_index': index,
-            'message': 'Command queued for delivery'
-        }), 202
+        return _queued_response(result, device_id, address,
+                                command_id=command_id, schedule_index=index)
 
     except Exception as e:
-        logger.error(f"Error removing schedule {index} for node {device_id}: {e}")
+        logger.error("Error removing schedule %s for node %s: %s", index, device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1121,17 +1511,13 @@ def get_schedules(device_id: int):
     Returns:
         JSON array of schedule entries
     """
-    try:
-        db = get_database()
-        schedules = db.get_schedules(device_id)
-        return jsonify({
-            'device_id': str(device_id),
-            'count': len(schedules),
-            'schedules': schedules,
-        })
-    except Exception as e:
-        logger.error(f"Error getting schedules for node {device_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    db = get_database()
+    schedules = db.get_schedules(device_id)
+    return jsonify({
+        'device_id': str(device_id),
+        'count': len(schedules),
+        'schedules': schedules,
+    })
 
 
 @app.route('/api/nodes/<int:device_id>/valve', methods=['POST'])
@@ -1159,9 +1545,9 @@ def run_valve(device_id: int):
         if address is None:
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         valve = data.get('valve')
         duration_seconds = data.get('duration_seconds')
@@ -1178,20 +1564,20 @@ def run_valve(device_id: int):
 
         # Record the command in the audit log BEFORE queueing so the dashboard
         # can surface "pending" state immediately on poll.
-        from command_queue import queue_send_actuator, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
         db = get_database()
         command_id = db.insert_command(
             device_id=device_id,
             command_type='valve_open',
             params={'valve': valve, 'duration_seconds': duration_seconds},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['valve_open'],
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['valve_open'],
         )
 
         # Send actuator ON command with duration — firmware sets RTC Alarm A
         # for auto-close after the specified duration (node sleeps in between)
         actuator_type = 1  # ACTUATOR_VALVE
         command = 1  # CMD_TURN_ON
-        result = queue_send_actuator(
+        result = cq.queue_send_actuator(
             node_address=address,
             actuator_type=actuator_type,
             command=command,
@@ -1209,19 +1595,13 @@ def run_valve(device_id: int):
             _queue_master_actuator(db, group, command=1,
                                    duration_seconds=duration_seconds)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'command_id': command_id,
-            'device_id': str(device_id),
-            'address': address,
-            'valve': valve,
-            'duration_seconds': duration_seconds,
-            'message': f'Valve {valve} run-once command queued ({duration_seconds}s)'
-        }), 202
+        return _queued_response(
+            result, device_id, address,
+            message=f'Valve {valve} run-once command queued ({duration_seconds}s)',
+            command_id=command_id, valve=valve, duration_seconds=duration_seconds)
 
     except Exception as e:
-        logger.error(f"Error running valve for node {device_id}: {e}")
+        logger.error("Error running valve for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1244,27 +1624,27 @@ def stop_valve(device_id: int):
         if address is None:
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         valve = data.get('valve')
         valve_count = _node_valve_count(device_id)
         if not isinstance(valve, int) or not 0 <= valve < valve_count:
             return jsonify({'error': f'valve must be 0..{valve_count - 1}'}), 400
 
-        from command_queue import queue_send_actuator, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
         db = get_database()
         command_id = db.insert_command(
             device_id=device_id,
             command_type='valve_close',
             params={'valve': valve},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['valve_close'],
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['valve_close'],
         )
 
         actuator_type = 1  # ACTUATOR_VALVE
         command = 0  # CMD_TURN_OFF
-        result = queue_send_actuator(
+        result = cq.queue_send_actuator(
             node_address=address,
             actuator_type=actuator_type,
             command=command,
@@ -1279,18 +1659,12 @@ def stop_valve(device_id: int):
         if group:
             _queue_master_actuator(db, group, command=0)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'command_id': command_id,
-            'device_id': str(device_id),
-            'address': address,
-            'valve': valve,
-            'message': f'Valve {valve} stop command queued'
-        }), 202
+        return _queued_response(result, device_id, address,
+                                message=f'Valve {valve} stop command queued',
+                                command_id=command_id, valve=valve)
 
     except Exception as e:
-        logger.error(f"Error stopping valve for node {device_id}: {e}")
+        logger.error("Error stopping valve for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1350,7 +1724,7 @@ def list_valve_groups():
         groups = db.get_all_valve_groups()
         return jsonify({'count': len(groups), 'groups': groups})
     except Exception as e:
-        logger.error(f"Error listing valve groups: {e}")
+        logger.error("Error listing valve groups: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1367,9 +1741,9 @@ def create_valve_group():
         }
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
         name = data.get('name')
         if not name:
             return jsonify({'error': 'name is required'}), 400
@@ -1398,7 +1772,7 @@ def create_valve_group():
 
         return jsonify(group), 201
     except Exception as e:
-        logger.error(f"Error creating valve group: {e}")
+        logger.error("Error creating valve group: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1412,7 +1786,7 @@ def get_valve_group(group_id: int):
             return jsonify(group)
         return jsonify({'error': f'Valve group {group_id} not found'}), 404
     except Exception as e:
-        logger.error(f"Error getting valve group {group_id}: {e}")
+        logger.error("Error getting valve group %s: %s", group_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1425,9 +1799,9 @@ def update_valve_group(group_id: int):
         if not old:
             return jsonify({'error': f'Valve group {group_id} not found'}), 404
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         name = data.get('name')
         master_device_id = (int(data['master_device_id'])
@@ -1466,7 +1840,7 @@ def update_valve_group(group_id: int):
 
         return jsonify(updated)
     except Exception as e:
-        logger.error(f"Error updating valve group {group_id}: {e}")
+        logger.error("Error updating valve group %s: %s", group_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1482,7 +1856,7 @@ def delete_valve_group(group_id: int):
         db.delete_valve_group(group_id)
         return jsonify({'status': 'deleted', 'id': group_id})
     except Exception as e:
-        logger.error(f"Error deleting valve group {group_id}: {e}")
+        logger.error("Error deleting valve group %s: %s", group_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1500,10 +1874,19 @@ def resync_valve_group(group_id: int):
             return jsonify({'error': f'Master valve schedule full: {e}'}), 409
         return jsonify({'status': 'resynced', 'id': group_id, **summary})
     except Exception as e:
-        logger.error(f"Error resyncing valve group {group_id}: {e}")
+        logger.error("Error resyncing valve group %s: %s", group_id, e)
         return jsonify({'error': str(e)}), 500
 
 
+_validate_wake_interval_body = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['interval_seconds'],
+    'properties': {
+        'interval_seconds': {'type': 'integer', 'minimum': 10, 'maximum': 3600},
+    },
+})
+
+
 @app.route('/api/nodes/<int:device_id>/wake-interval', methods=['POST'])
 def set_wake_interval(device_id: int):
     """Set periodic wake interval for a node.
@@ -1524,48 +1907,66 @@ def set_wake_interval(device_id: int):
         if address is None:
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
         try:
-            interval = int(data['interval_seconds'])
-        except (KeyError, ValueError) as e:
-            return jsonify({'error': 'Invalid interval_seconds value'}), 400
-
-        if not 10 <= interval <= 3600:
-            return jsonify({'error': 'interval_seconds must be 10-3600'}), 400
+            _validate_wake_interval_body(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return jsonify({'error': e.message}), 400
+        interval = data['interval_seconds']
 
         # Queue command for delivery (uses address for hub routing)
-        from command_queue import queue_set_wake_interval, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
         db = get_database()
         command_id = db.insert_command(
             device_id=device_id,
             command_type='wake_interval',
             params={'interval_seconds': interval},
-            ttl_seconds=COMMAND_TTL_DEFAULTS['wake_interval'],
+            ttl_seconds=cq.COMMAND_TTL_DEFAULTS['wake_interval'],
         )
 
-        result = queue_set_wake_interval(node_address=address, interval_seconds=interval)
+        result = cq.queue_set_wake_interval(node_address=address, interval_seconds=interval)
 
         if command_id is not None:
             db.set_command_huey_task(command_id, result.id)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'command_id': command_id,
-            'device_id': str(device_id),  # String to preserve JS precision
-            'address': address,
-            'interval_seconds': interval,
-            'message': 'Command queued for delivery'
-        }), 202
+        return _queued_response(result, device_id, address,
+                                command_id=command_id, interval_seconds=interval)
 
     except Exception as e:
-        logger.error(f"Error setting wake interval for node {device_id}: {e}")
+        logger.error("Error setting wake interval for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
+# Field table driving set_datetime validation: (name, lo, hi, error message).
+# One loop replaces seven hand-written extract-and-range-check blocks.
+# RTC field ranges (year is two-digit, weekday is 1=Monday..7=Sunday). The
+# compiled validator below is derived from this table so the ranges live in
+# one place.
+_DATETIME_FIELDS = (
+    ('year', 0, 99),
+    ('month', 1, 12),
+    ('day', 1, 31),
+    ('weekday', 1, 7),
+    ('hour', 0, 23),
+    ('minute', 0, 59),
+    ('second', 0, 59),
+)
+
+_validate_datetime_body = fastjsonschema.compile({
+    'type': 'object',
+    # weekday is optional — it is derivable from the date, so it is computed
+    # (and cross-checked when supplied) in the handler instead of trusted.
+    'required': [name for name, _, _ in _DATETIME_FIELDS if name != 'weekday'],
+    'properties': {
+        name: {'type': 'integer', 'minimum': lo, 'maximum': hi}
+        for name, lo, hi in _DATETIME_FIELDS
+    },
+})
+
+
 @app.route('/api/nodes/<int:device_id>/datetime', methods=['POST'])
 def set_datetime(device_id: int):
     """Set date/time for a node's RTC.
@@ -1578,7 +1979,7 @@ def set_datetime(device_id: int):
             "year": 25,      # 2025 = 25
             "month": 10,     # 1-12
             "day": 19,       # 1-31
-            "weekday": 7,    # 1-7 (1=Monday, 7=Sunday)
+            "weekday": 7,    # optional, derived from the date (1=Monday, 7=Sunday)
             "hour": 9,       # 0-23
             "minute": 4,     # 0-59
             "second": 0      # 0-59
@@ -1592,71 +1993,42 @@ def set_datetime(device_id: int):
         if address is None:
             return jsonify({'error': f'Node with device_id {device_id} not found'}), 404
 
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
-        # Extract and validate datetime fields
+        # Validate shape and ranges against the compiled schema
         try:
-            year = int(data['year'])
-            month = int(data['month'])
-            day = int(data['day'])
-            weekday = int(data['weekday'])
-            hour = int(data['hour'])
-            minute = int(data['minute'])
-            second = int(data['second'])
-        except (KeyError, ValueError) as e:
-            return jsonify({'error': f'Invalid datetime field: {e}'}), 400
-
-        # Validate ranges
-        if not (0 <= year <= 99):
-            return jsonify({'error': 'year must be 0-99 (e.g., 25 for 2025)'}), 400
-        if not (1 <= month <= 12):
-            return jsonify({'error': 'month must be 1-12'}), 400
-        if not (1 <= day <= 31):
-            return jsonify({'error': 'day must be 1-31'}), 400
-        if not (1 <= weekday <= 7):
-            return jsonify({'error': 'weekday must be 1-7 (1=Monday, 7=Sunday)'}), 400
-        if not (0 <= hour <= 23):
-            return jsonify({'error': 'hour must be 0-23'}), 400
-        if not (0 <= minute <= 59):
-            return jsonify({'error': 'minute must be 0-59'}), 400
-        if not (0 <= second <= 59):
-            return jsonify({'error': 'second must be 0-59'}), 400
+            _validate_datetime_body(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return jsonify({'error': e.message}), 400
+
+        # Calendar consistency (e.g. Feb 30) in one constructor call, which
+        # also gives us the weekday — derived rather than trusted, and
+        # cross-checked when the client still sends one.
+        try:
+            parsed = datetime(2000 + data['year'], data['month'], data['day'],
+                              data['hour'], data['minute'], data['second'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        weekday = parsed.isoweekday()  # 1=Monday..7=Sunday
+        if data.get('weekday', weekday) != weekday:
+            return jsonify({'error': f'weekday does not match date (expected {weekday})'}), 400
+
+        fields = {name: data[name] for name, _, _ in _DATETIME_FIELDS
+                  if name != 'weekday'}
+        fields['weekday'] = weekday
 
         # Queue command for delivery (uses address for hub routing)
-        from command_queue import queue_set_datetime
+        cq = _get_command_queue()
 
-        result = queue_set_datetime(
-            node_address=address,
-            year=year,
-            month=month,
-            day=day,
-            weekday=weekday,
-            hour=hour,
-            minute=minute,
-            second=second
-        )
+        result = cq.queue_set_datetime(node_address=address, **fields)
 
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'device_id': str(device_id),  # String to preserve JS precision
-            'address': address,
-            'datetime': {
-                'year': year,
-                'month': month,
-                'day': day,
-                'weekday': weekday,
-                'hour': hour,
-                'minute': minute,
-                'second': second
-            },
-            'message': 'Command queued for delivery'
-        }), 202
+        return _queued_response(result, device_id, address, datetime=fields)
 
     except Exception as e:
-        logger.error(f"Error setting datetime for node {device_id}: {e}")
+        logger.error("Error setting datetime for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1673,21 +2045,16 @@ def reboot_node(address: int):
     Returns:
         JSON response with task_id for tracking (202 Accepted)
     """
-    try:
-        from command_queue import queue_reboot_node
+    cq = _get_command_queue()
 
-        result = queue_reboot_node(node_address=address)
-
-        return jsonify({
-            'status': 'queued',
-            'task_id': result.id,
-            'node_address': address,
-            'message': 'Reboot command queued for delivery'
-        }), 202
+    result = cq.queue_reboot_node(node_address=address)
 
-    except Exception as e:
-        logger.error(f"Error queueing reboot for node {address}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'status': 'queued',
+        'task_id': result.id,
+        'node_address': address,
+        'message': 'Reboot command queued for delivery'
+    }), 202
 
 
 @app.route('/api/nodes/<int:address>/curtain', methods=['POST'])
@@ -1703,7 +2070,7 @@ def control_curtain(address: int):
     Returns:
         JSON response with task_id for tracking (202 Accepted)
     """
-    data = request.get_json()
+    data = _json_body()
     if not data or 'action' not in data:
         return jsonify({'error': 'Missing action field'}), 400
 
@@ -1719,7 +2086,7 @@ def control_curtain(address: int):
         return jsonify({'error': f'Invalid action: {action}. Must be open, close, stop, or calibrate'}), 400
 
     try:
-        from command_queue import queue_send_actuator, COMMAND_TTL_DEFAULTS
+        cq = _get_command_queue()
 
         # Reverse-lookup device_id from address so we can write a row to the
         # node_commands audit log. If lookup fails, skip the insert and warn
@@ -1737,7 +2104,7 @@ def control_curtain(address: int):
                     device_id=int(row[0]),
                     command_type='curtain',
                     params={'action': action},
-                    ttl_seconds=COMMAND_TTL_DEFAULTS['curtain'],
+                    ttl_seconds=cq.COMMAND_TTL_DEFAULTS['curtain'],
                 )
             else:
                 logger.warning(
@@ -1745,11 +2112,11 @@ def control_curtain(address: int):
                     "skipping audit-log insert"
                 )
         except Exception as e:
-            logger.warning(f"Curtain command audit-log insert failed: {e}")
+            logger.warning("Curtain command audit-log insert failed: %s", e)
 
         actuator_type = 4  # ACTUATOR_CURTAIN
         command = action_map[action]
-        result = queue_send_actuator(
+        result = cq.queue_send_actuator(
             node_address=address,
             actuator_type=actuator_type,
             command=command,
@@ -1768,7 +2135,7 @@ def control_curtain(address: int):
         }), 202
 
     except Exception as e:
-        logger.error(f"Error queueing curtain command for node {address}: {e}")
+        logger.error("Error queueing curtain command for node %s: %s", address, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1822,7 +2189,7 @@ def get_node_events(device_id: int):
         })
 
     except Exception as e:
-        logger.error(f"Error querying events for device {device_id}: {e}")
+        logger.error("Error querying events for device %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1846,7 +2213,7 @@ def get_node_commands(device_id: int):
         try:
             db.expire_stale_commands(int(time.time()))
         except Exception as e:
-            logger.warning(f"Expire sweep failed: {e}")
+            logger.warning("Expire sweep failed: %s", e)
 
         status_csv = request.args.get('status')
         status_list = (
@@ -1875,7 +2242,7 @@ def get_node_commands(device_id: int):
         })
 
     except Exception as e:
-        logger.error(f"Error querying commands for device {device_id}: {e}")
+        logger.error("Error querying commands for device %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1891,6 +2258,11 @@ def get_sensor_data():
         end_time: End timestamp (optional)
         limit: Maximum records to return (default 1000)
         offset: Number of records to skip (default 0)
+        cursor: Keyset cursor from a previous page's next_cursor; pages in
+            O(limit) at any depth, unlike offset. Overrides offset.
+        include_total: Set to false to skip the total count (null in the
+            response). With time filters the count is a scan that cannot
+            stop early; cursor-paging clients don't need it.
 
     Returns:
         JSON array of sensor readings
@@ -1904,6 +2276,7 @@ def get_sensor_data():
         end_time = request.args.get('end_time', type=int)
         limit = request.args.get('limit', default=1000, type=int)
         offset = request.args.get('offset', default=0, type=int)
+        cursor = request.args.get('cursor')
 
         # Validate limits
         if limit < 1 or limit > 10000:
@@ -1911,32 +2284,50 @@ def get_sensor_data():
         if offset < 0:
             return jsonify({'error': 'offset must be >= 0'}), 400
 
-        # Query database
-        readings = db.query_readings(
+        before = None
+        if cursor is not None:
+            try:
+                timestamp_part, id_part = cursor.split(':', 1)
+                before = (int(timestamp_part), int(id_part))
+            except ValueError:
+                return jsonify({'error': 'cursor must be "<timestamp>:<id>"'}), 400
+
+        include_total = request.args.get('include_total', 'true').lower() != 'false'
+
+        # Run the pagination COUNT alongside the page query — independent
+        # statements, and DuckDB cursors support concurrent reads.
+        future_total = None
+        if include_total:
+            future_total = _pool.submit(
+                db.get_reading_count,
+                device_id=device_id,
+                start_time=start_time,
+                end_time=end_time
+            )
+
+        # Query database (JSON-ready dicts; skips the dataclass layer)
+        readings, next_cursor = db.query_reading_dicts(
             device_id=device_id,
             start_time=start_time,
             end_time=end_time,
             limit=limit,
-            offset=offset
+            offset=offset,
+            before=before
         )
 
-        # Get total count for pagination
-        total = db.get_reading_count(
-            device_id=device_id,
-            start_time=start_time,
-            end_time=end_time
-        )
+        total = future_total.result() if future_total is not None else None
 
         return jsonify({
             'count': len(readings),
             'total': total,
             'limit': limit,
             'offset': offset,
-            'readings': [r.to_dict() for r in readings]
+            'next_cursor': f'{next_cursor[0]}:{next_cursor[1]}' if next_cursor else None,
+            'readings': readings
         })
 
     except Exception as e:
-        logger.error(f"Error querying sensor data: {e}")
+        logger.error("Error querying sensor data: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1978,7 +2369,7 @@ def export_sensor_data():
         )
 
     except Exception as e:
-        logger.error(f"Error exporting sensor data: {e}")
+        logger.error("Error exporting sensor data: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1994,47 +2385,49 @@ def get_node_sensor_data(device_id: int):
         end_time: End timestamp (optional, required for downsampling)
         limit: Maximum records to return (default 100, ignored when downsampling)
         downsample: Max data points for chart display (optional, enables bucket averaging)
+        debug: If set, include _timing instrumentation in the response
 
     Returns:
         JSON array of sensor readings for this node
     """
     try:
-        request_start = time.time()
         db = get_database()
 
         start_time = request.args.get('start_time', type=int)
         end_time = request.args.get('end_time', type=int)
         limit = request.args.get('limit', default=100, type=int)
         downsample = request.args.get('downsample', type=int)
+        debug = request.args.get('debug') is not None
 
         # Use downsampled query for chart display
         if downsample and start_time and end_time:
-            query_start = time.time()
+            request_start = time.time()
             readings = db.query_readings_downsampled(
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
                 max_points=min(downsample, 2000)  # Cap at 2000 points
             )
-            query_time = time.time() - query_start
+            query_time = time.time() - request_start
 
-            json_start = time.time()
             response_data = {
                 'device_id': str(device_id),  # String to preserve JS precision
                 'count': len(readings),
                 'downsampled': True,
                 'readings': readings,  # Already in chart format
-                '_timing': {
+            }
+            if debug:
+                # Timing instrumentation stays opt-in — prod clients don't
+                # need the extra float math or payload bytes.
+                response_data['_timing'] = {
                     'query_ms': round(query_time * 1000, 1),
-                    'json_ms': round((time.time() - json_start) * 1000, 1),
                     'total_ms': round((time.time() - request_start) * 1000, 1),
                 }
-            }
-            logger.info(f"sensor-data: query={query_time*1000:.0f}ms, readings={len(readings)}")
+            logger.info("sensor-data: query=%.0fms, readings=%s", query_time*1000, len(readings))
             return jsonify(response_data)
 
-        # Standard query for full data
-        readings = db.query_readings(
+        # Standard query for full data (chart-shaped dicts straight from rows)
+        readings = db.query_chart_dicts(
             device_id=device_id,
             start_time=start_time,
             end_time=end_time,
@@ -2044,11 +2437,11 @@ def get_node_sensor_data(device_id: int):
         return jsonify({
             'device_id': str(device_id),  # String to preserve JS precision
             'count': len(readings),
-            'readings': [r.to_chart_dict() for r in readings]
+            'readings': readings
         })
 
     except Exception as e:
-        logger.error(f"Error getting sensor data for node {device_id}: {e}")
+        logger.error("Error getting sensor data for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -2072,7 +2465,7 @@ def get_node_latest(device_id: int):
             return jsonify({'error': f'No readings found for node {device_id}'}), 404
 
     except Exception as e:
-        logger.error(f"Error getting latest reading for node {device_id}: {e}")
+        logger.error("Error getting latest reading for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -2086,33 +2479,35 @@ def get_node_statistics(device_id: int):
     Query parameters:
         start_time: Start timestamp for stats calculation (optional)
         end_time: End timestamp for stats calculation (optional)
+        debug: If set, include _timing instrumentation in the response
 
     Returns:
         JSON object with node statistics
     """
     try:
-        request_start = time.time()
         db = get_database()
 
         start_time = request.args.get('start_time', type=int)
         end_time = request.args.get('end_time', type=int)
+        debug = request.args.get('debug') is not None
 
         query_start = time.time()
         stats = db.get_node_statistics(device_id, start_time=start_time, end_time=end_time)
         query_time = time.time() - query_start
 
         if stats:
-            stats['_timing'] = {
-                'query_ms': round(query_time * 1000, 1),
-                'total_ms': round((time.time() - request_start) * 1000, 1),
-            }
-            logger.info(f"statistics: query={query_time*1000:.0f}ms")
+            if debug:
+                stats['_timing'] = {
+                    'query_ms': round(query_time * 1000, 1),
+                    'total_ms': round((time.time() - query_start) * 1000, 1),
+                }
+            logger.info("statistics: query=%.0fms", query_time*1000)
             return jsonify(stats)
         else:
             return jsonify({'error': f'No data found for node {device_id}'}), 404
 
     except Exception as e:
-        logger.error(f"Error getting statistics for node {device_id}: {e}")
+        logger.error("Error getting statistics for node %s: %s", device_id, e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -2129,51 +2524,134 @@ def get_task_status(task_id: str):
         JSON with task status (pending, completed, or failed)
     """
     try:
-        from command_queue import huey
+        cq = _get_command_queue()
+        from huey.exceptions import TaskException
 
-        result = huey.result(task_id)
-
-        if result is None:
-            return jsonify({'status': 'pending', 'task_id': task_id})
-        elif isinstance(result, Exception):
+        try:
+            # preserve=True: reading a ready result must not consume it, or
+            # the next poll of a finished task would report pending forever.
+            result = cq.huey.result(task_id, preserve=True)
+        except TaskException as e:
             return jsonify({
                 'status': 'failed',
                 'task_id': task_id,
-                'error': str(result)
-            })
-        else:
-            return jsonify({
-                'status': 'completed',
-                'task_id': task_id,
-                'result': result
+                'error': e.metadata.get('error', str(e))
             })
 
+        if result is None:
+            return jsonify({'status': 'pending', 'task_id': task_id})
+        return jsonify({
+            'status': 'completed',
+            'task_id': task_id,
+            'result': result
+        })
+
     except Exception as e:
-        logger.error(f"Error getting task status for {task_id}: {e}")
+        logger.error("Error getting task status for %s: %s", task_id, e)
         return jsonify({'error': str(e)}), 500
 
 
-# ===== Zone Endpoints =====
+@app.route('/api/tasks/<task_id>/wait', methods=['GET'])
+def wait_for_task(task_id: str):
+    """Long-poll for a queued command's result.
 
-@app.route('/api/zones', methods=['GET'])
-def list_zones():
-    """List all zones.
+    Blocks server-side on the huey result store instead of making the client
+    hammer /api/tasks/<id> once a second. Returns as soon as the task
+    resolves; if it is still pending after the timeout, returns a pending
+    status and the client re-polls.
+
+    Args:
+        task_id: The task ID returned when command was queued
+
+    Query parameters:
+        timeout: Seconds to block waiting for the result (default 30, max 30)
 
     Returns:
-        JSON array of zone objects
+        JSON with task status (pending, completed, or failed)
     """
+    cq = _get_command_queue()
+    from huey.exceptions import HueyException, TaskException
+
+    timeout = request.args.get('timeout', default=30, type=int)
+    timeout = max(1, min(timeout, 30))
+
     try:
-        db = get_database()
-        zones = db.get_all_zones()
+        result = cq.huey.result(task_id, blocking=True, timeout=timeout,
+                                preserve=True)
         return jsonify({
-            'count': len(zones),
-            'zones': zones
+            'status': 'completed',
+            'task_id': task_id,
+            'result': result
         })
+    except TaskException as e:
+        return jsonify({
+            'status': 'failed',
+            'task_id': task_id,
+            'error': e.metadata.get('error', str(e))
+        })
+    except HueyException:
+        # Timed out waiting — task still pending, client should retry
+        return jsonify({'status': 'pending', 'task_id': task_id})
     except Exception as e:
-        logger.error(f"Error listing zones: {e}")
+        logger.error("Error waiting for task %s: %s", task_id, e)
         return jsonify({'error': str(e)}), 500
 
 
+# ===== Zone Endpoints =====
+
+@app.route('/api/zones', methods=['GET'])
+def list_zones():
+    """List all zones.
+
+    Returns:
+        JSON array of zone objects
+    """
+    zones = get_database().get_all_zones()
+    return jsonify({
+        'count': len(zones),
+        'zones': zones
+    })
+
+
+# Zone POST/PUT bodies, validated through the same compiled-schema path as
+# the node command endpoints. The hex-color pattern subsumes the old manual
+# startswith('#')/length checks.
+_ZONE_COLOR_SCHEMA = {'type': 'string', 'pattern': '^#[0-9a-fA-F]{6}$'}
+_validate_zone_body = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['name', 'color'],
+    'properties': {
+        'name': {'type': 'string', 'minLength': 1},
+        'color': _ZONE_COLOR_SCHEMA,
+        'description': {'type': ['string', 'null']},
+    },
+})
+_validate_zone_update_body = fastjsonschema.compile({
+    'type': 'object',
+    'properties': {
+        'name': {'type': ['string', 'null']},
+        'color': {**_ZONE_COLOR_SCHEMA, 'type': ['string', 'null']},
+        'description': {'type': ['string', 'null']},
+    },
+})
+
+
+@lru_cache(maxsize=1024)
+def _zone_404_body(zone_id) -> bytes:
+    """Encoded 'Zone N not found' body; the same IDs recur under probing.
+
+    Bytes only — the Response is built per call (shared Responses break under
+    CORS/compression header mutation). Bounded so random-ID scans can't grow
+    memory.
+    """
+    return orjson.dumps({'error': f'Zone {zone_id} not found'})
+
+
+def _zone_404(zone_id) -> Response:
+    """404 response for a missing zone."""
+    return _error_response(_zone_404_body(zone_id), 404)
+
+
 @app.route('/api/zones', methods=['POST'])
 def create_zone():
     """Create a new zone.
@@ -2188,69 +2666,35 @@ def create_zone():
     Returns:
         JSON zone object (201 Created)
     """
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
-
-        name = data.get('name')
-        color = data.get('color')
+    data = _json_body()
+    if not data:
+        return _error_response(_ERR_BODY_NOT_JSON, 400)
 
-        if not name:
-            return jsonify({'error': 'name is required'}), 400
-        if not color:
-            return jsonify({'error': 'color is required'}), 400
-
-        # Validate color format (hex color)
-        if not color.startswith('#') or len(color) != 7:
-            return jsonify({'error': 'color must be a hex color (e.g., #4CAF50)'}), 400
-
-        db = get_database()
-        zone = db.create_zone(
-            name=name,
-            color=color,
-            description=data.get('description')
-        )
-
-        return jsonify(zone), 201
-
-    except Exception as e:
-        logger.error(f"Error creating zone: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@app.route('/api/zones/<int:zone_id>', methods=['GET'])
-def get_zone(zone_id: int):
-    """Get a zone by ID.
-
-    Args:
-        zone_id: Zone ID
-
-    Returns:
-        JSON zone object or 404 if not found
-    """
     try:
-        db = get_database()
-        zone = db.get_zone(zone_id)
+        _validate_zone_body(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        return jsonify({'error': e.message}), 400
 
-        if zone:
-            return jsonify(zone)
-        else:
-            return jsonify({'error': f'Zone {zone_id} not found'}), 404
+    zone = get_database().create_zone(
+        name=data['name'],
+        color=data['color'],
+        description=data.get('description')
+    )
 
-    except Exception as e:
-        logger.error(f"Error getting zone {zone_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify(zone), 201
 
 
-@app.route('/api/zones/<int:zone_id>', methods=['PUT'])
-def update_zone(zone_id: int):
-    """Update a zone.
+@app.route('/api/zones/<int:zone_id>', methods=['GET', 'PUT', 'DELETE'])
+def zone(zone_id: int):
+    """Get (GET), update (PUT), or delete (DELETE) a zone.
+
+    One routing entry covers all three verbs — the method dispatch below is
+    cheaper than three separate rules in the URL map.
 
     Args:
         zone_id: Zone ID
 
-    Request body:
+    PUT request body (all fields optional):
         {
             "name": "Updated Name",
             "color": "#FF5722",
@@ -2258,58 +2702,41 @@ def update_zone(zone_id: int):
         }
 
     Returns:
-        JSON updated zone object or 404 if not found
+        JSON zone object (GET/PUT) or success message (DELETE);
+        404 if the zone is not found
     """
-    try:
-        data = request.get_json()
+    db = get_database()
+
+    if request.method == 'GET':
+        found = db.get_zone(zone_id)
+        if found:
+            return jsonify(found)
+        return _zone_404(zone_id)
+
+    if request.method == 'PUT':
+        data = _json_body()
         if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
+            return _error_response(_ERR_BODY_NOT_JSON, 400)
 
-        # Validate color format if provided
-        color = data.get('color')
-        if color and (not color.startswith('#') or len(color) != 7):
-            return jsonify({'error': 'color must be a hex color (e.g., #4CAF50)'}), 400
+        try:
+            _validate_zone_update_body(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return jsonify({'error': e.message}), 400
 
-        db = get_database()
-        zone = db.update_zone(
+        updated = db.update_zone(
             zone_id=zone_id,
             name=data.get('name'),
-            color=color,
+            color=data.get('color'),
             description=data.get('description')
         )
+        if updated:
+            return jsonify(updated)
+        return _zone_404(zone_id)
 
-        if zone:
-            return jsonify(zone)
-        else:
-            return jsonify({'error': f'Zone {zone_id} not found'}), 404
-
-    except Exception as e:
-        logger.error(f"Error updating zone {zone_id}: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@app.route('/api/zones/<int:zone_id>', methods=['DELETE'])
-def delete_zone(zone_id: int):
-    """Delete a zone. Nodes in this zone become unzoned.
-
-    Args:
-        zone_id: Zone ID
-
-    Returns:
-        JSON success message or 404 if not found
-    """
-    try:
-        db = get_database()
-        deleted = db.delete_zone(zone_id)
-
-        if deleted:
-            return jsonify({'message': f'Zone {zone_id} deleted'})
-        else:
-            return jsonify({'error': f'Zone {zone_id} not found'}), 404
-
-    except Exception as e:
-        logger.error(f"Error deleting zone {zone_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    # DELETE — nodes in this zone become unzoned
+    if db.delete_zone(zone_id):
+        return jsonify({'message': f'Zone {zone_id} deleted'})
+    return _zone_404(zone_id)
 
 
 @app.route('/api/nodes/<int:device_id>/zone', methods=['PUT'])
@@ -2332,33 +2759,18 @@ def set_node_zone(device_id: int):
     Returns:
         JSON updated node metadata
     """
-    try:
-        data = request.get_json()
-        if data is None:
-            return jsonify({'error': 'Request body must be JSON'}), 400
-
-        zone_id = data.get('zone_id')
-
-        # Validate zone exists if not null
-        if zone_id is not None:
-            db = get_database()
-            zone = db.get_zone(zone_id)
-            if not zone:
-                return jsonify({'error': f'Zone {zone_id} not found'}), 404
-
-        db = get_database()
-        metadata = db.set_node_zone(device_id, zone_id)
+    data = _json_body()
+    if data is None:
+        return _error_response(_ERR_BODY_NOT_JSON, 400)
 
-        if metadata:
-            return jsonify(metadata)
-        else:
-            # Node metadata doesn't exist yet, create it
-            metadata = db.update_node_metadata(device_id, zone_id=zone_id if zone_id else -1)
-            return jsonify(metadata)
+    zone_id = data.get('zone_id')
 
-    except Exception as e:
-        logger.error(f"Error setting zone for node {device_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    # Zone validation and the metadata upsert happen inside one DB call;
+    # None means the zone doesn't exist (the upsert itself can't miss).
+    metadata = get_database().set_node_zone(device_id, zone_id)
+    if metadata is None:
+        return _zone_404(zone_id)
+    return jsonify(metadata)
 
 
 @app.route('/api/internal/hub-command', methods=['POST'])
@@ -2378,14 +2790,14 @@ def internal_hub_command():
         JSON with status and response lines
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data or 'command' not in data:
             return jsonify({'error': 'command is required'}), 400
 
         command = data['command']
         command_id = data.get('command_id', 'unknown')
 
-        logger.info(f"[{command_id}] Internal hub command: {command}")
+        logger.info("[%s] Internal hub command: %s", command_id, command)
 
         serial = get_serial()
         responses = serial.send_command(command)
@@ -2396,40 +2808,47 @@ def internal_hub_command():
         })
 
     except TimeoutError:
-        return jsonify({'error': 'Hub did not respond'}), 504
+        return _error_response(_ERR_HUB_TIMEOUT, 504)
     except Exception as e:
-        logger.error(f"Internal hub command failed: {e}")
+        logger.error("Internal hub command failed: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return _error_response(_ERR_NOT_FOUND, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}")
-    return jsonify({'error': 'Internal server error'}), 500
+    logger.error("Internal server error: %s", error)
+    return _error_response(_ERR_INTERNAL, 500)
+
+
+def connect_serial_at_startup():
+    """Open the hub serial link now instead of on the first API call.
+
+    Idempotent — get_serial() is a singleton — so the dev server, the
+    gunicorn post_fork hook, and any future initializer can all call it.
+    """
+    logger.info("Connecting to hub via serial...")
+    get_serial()
+    logger.info("Serial connection established - ready to respond to GET_DATETIME queries")
 
 
 def main():
-    """Run the Flask application."""
+    """Run the Flask application (Werkzeug dev server; production uses gunicorn)."""
     try:
-        logger.info(f"Starting Bramble API on {Config.HOST}:{Config.PORT}")
-        logger.info(f"Serial port: {Config.SERIAL_PORT} @ {Config.SERIAL_BAUD} baud")
+        logger.info("Starting Bramble API on %s:%s", Config.HOST, Config.PORT)
+        logger.info("Serial port: %s @ %s baud", Config.SERIAL_PORT, Config.SERIAL_BAUD)
 
-        # Initialize serial interface on startup (don't wait for first API call)
-        # Note: In debug mode, Flask restarts the app, so this runs twice
-        # Use werkzeug.serving.is_running_from_reloader to detect reloader
+        # In debug mode the reloader restarts the app; connect only in the
+        # reloader subprocess so the port isn't opened twice.
         import os
         if not Config.DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
-            # Only connect in production or in the reloader subprocess
-            logger.info("Connecting to hub via serial...")
-            serial = get_serial()
-            logger.info("Serial connection established - ready to respond to GET_DATETIME queries")
+            connect_serial_at_startup()
 
         app.run(
             host=Config.HOST,
@@ -34,6 +34,17 @@ COMMAND_TTL_DEFAULTS = {
     'schedule_remove': 1800,
 }
 
+# On-wire command templates. Each format lives in exactly one constant and is
+# rendered with the '%' operator — a single C-level formatting call per
+# command. The serial layer encodes the finished line to bytes once on write.
+_SET_SCHEDULE_FMT = "SET_SCHEDULE %d %d %d:%d %d %d %d"
+_REMOVE_SCHEDULE_FMT = "REMOVE_SCHEDULE %d %d"
+_WAKE_INTERVAL_FMT = "SET_WAKE_INTERVAL %d %d"
+_DATETIME_FMT = "SET_DATETIME %d %d %d %d %d %d %d %d"
+_REBOOT_FMT = "REBOOT_NODE %d"
+_ACTUATOR_FMT = "SEND_ACTUATOR %d %d %d %d"
+_ACTUATOR_TIMED_FMT = "SEND_ACTUATOR %d %d %d %d %d"
+
 
 def _send_via_api(command: str, command_id: str) -> dict:
     """Send a hub command through the API's serial connection.
@@ -78,25 +89,25 @@ def send_hub_command(command: str, command_id: str) -> dict:
     Returns:
         dict with status and response
     """
-    logger.info(f"[{command_id}] Sending command: {command}")
+    logger.info("[%s] Sending command: %s", command_id, command)
 
     try:
         result = _send_via_api(command, command_id)
         responses = result.get('responses', [])
 
         if responses and responses[0].startswith('QUEUED'):
-            logger.info(f"[{command_id}] Command queued on hub: {responses[0]}")
+            logger.info("[%s] Command queued on hub: %s", command_id, responses[0])
             return {'status': 'success', 'response': responses}
         else:
-            logger.warning(f"[{command_id}] Unexpected response: {responses}")
+            logger.warning("[%s] Unexpected response: %s", command_id, responses)
             return {'status': 'warning', 'response': responses}
 
     except TimeoutError:
-        logger.error(f"[{command_id}] Hub timeout - will retry")
+        logger.error("[%s] Hub timeout - will retry", command_id)
         raise  # Raising causes huey to retry
 
     except Exception as e:
-        logger.error(f"[{command_id}] Failed: {e}")
+        logger.error("[%s] Failed: %s", command_id, e)
         raise
 
 
@@ -105,7 +116,7 @@ def _set_schedule_command(node_address: int, index: int, hour: int, minute: int,
     """Build the (command, command_id) pair for a SET_SCHEDULE. Single source of
     the on-wire format, shared by the single-op and ordered-batch paths."""
     return (
-        f"SET_SCHEDULE {node_address} {index} {hour}:{minute} {duration} {days} {valve}",
+        _SET_SCHEDULE_FMT % (node_address, index, hour, minute, duration, days, valve),
         f"schedule-{node_address}-{index}",
     )
 
@@ -113,7 +124,7 @@ def _set_schedule_command(node_address: int, index: int, hour: int, minute: int,
 def _remove_schedule_command(node_address: int, index: int) -> tuple:
     """Build the (command, command_id) pair for a REMOVE_SCHEDULE."""
     return (
-        f"REMOVE_SCHEDULE {node_address} {index}",
+        _REMOVE_SCHEDULE_FMT % (node_address, index),
         f"remove-schedule-{node_address}-{index}",
     )
 
@@ -134,15 +145,15 @@ def send_hub_commands_ordered(commands: list) -> dict:
     """
     results = []
     for command, command_id in commands:
-        logger.info(f"[{command_id}] Sending (ordered): {command}")
+        logger.info("[%s] Sending (ordered): %s", command_id, command)
         try:
             result = _send_via_api(command, command_id)
         except TimeoutError:
-            logger.error(f"[{command_id}] Hub timeout - will retry batch")
+            logger.error("[%s] Hub timeout - will retry batch", command_id)
             raise
         responses = result.get('responses', [])
         if not (responses and responses[0].startswith('QUEUED')):
-            logger.warning(f"[{command_id}] Unexpected response: {responses}")
+            logger.warning("[%s] Unexpected response: %s", command_id, responses)
         results.append({'command_id': command_id, 'response': responses})
     return {'status': 'success', 'results': results}
 
@@ -196,7 +207,7 @@ def queue_set_wake_interval(node_address: int, interval_seconds: int):
     Returns:
         huey TaskResultWrapper for tracking status
     """
-    command = f"SET_WAKE_INTERVAL {node_address} {interval_seconds}"
+    command = _WAKE_INTERVAL_FMT % (node_address, interval_seconds)
     command_id = f"wake-{node_address}"
     return send_hub_command(command, command_id)
 
@@ -208,7 +219,8 @@ def queue_set_datetime(node_address: int, year: int, month: int, day: int,
     Returns:
         huey TaskResultWrapper for tracking status
     """
-    command = f"SET_DATETIME {node_address} {year} {month} {day} {weekday} {hour} {minute} {second}"
+    command = _DATETIME_FMT % (node_address, year, month, day, weekday,
+                               hour, minute, second)
     command_id = f"datetime-{node_address}"
     return send_hub_command(command, command_id)
 
@@ -219,7 +231,7 @@ def queue_reboot_node(node_address: int):
     Returns:
         huey TaskResultWrapper for tracking status
     """
-    command = f"REBOOT_NODE {node_address}"
+    command = _REBOOT_FMT % node_address
     command_id = f"reboot-{node_address}"
     return send_hub_command(command, command_id)
 
@@ -239,8 +251,9 @@ def queue_send_actuator(node_address: int, actuator_type: int, command: int,
         huey TaskResultWrapper for tracking status
     """
     if duration_seconds > 0:
-        cmd = f"SEND_ACTUATOR {node_address} {actuator_type} {command} {param} {duration_seconds}"
+        cmd = _ACTUATOR_TIMED_FMT % (node_address, actuator_type, command,
+                                     param, duration_seconds)
     else:
-        cmd = f"SEND_ACTUATOR {node_address} {actuator_type} {command} {param}"
+        cmd = _ACTUATOR_FMT % (node_address, actuator_type, command, param)
     command_id = f"actuator-{node_address}-{actuator_type}-{command}"
     return send_hub_command(cmd, command_id)
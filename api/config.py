@@ -25,6 +25,17 @@ class Config:
     COMMAND_TIMEOUT = float(os.getenv('COMMAND_TIMEOUT', '5.0'))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
 
+    # LIST_NODES responses are cached this long so request bursts from the
+    # dashboard (node list + per-node address/valve-count lookups) share one
+    # hub round-trip. Sub-second is enough to collapse bursts while staying
+    # effectively live for users.
+    NODES_CACHE_TTL = float(os.getenv('NODES_CACHE_TTL', '0.5'))
+
+    # Per-node GET_QUEUE responses are cached briefly and duplicate in-flight
+    # requests share one hub round-trip (single-flight). Polling dashboards
+    # query every node at the same interval, so duplicates are common.
+    HUB_QUEUE_CACHE_TTL = float(os.getenv('HUB_QUEUE_CACHE_TTL', '0.2'))
+
     # Serial link is considered stale (effectively down) if no line has been
     # received from the hub within this many seconds. The hub emits GET_DATETIME
     # and heartbeats continuously, so a gap this long means the link is dead even
@@ -14,9 +14,14 @@ from config import Config
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
-    """Represents a single sensor data reading."""
+    """Represents a single sensor data reading.
+
+    Slotted: readings are allocated per row on the ingest path and in bulk
+    by query_readings, so skipping the per-instance __dict__ trims both
+    memory and attribute-lookup time.
+    """
     device_id: int  # Primary identifier (64-bit hardware unique ID)
     timestamp: int  # Unix timestamp in seconds
     temperature_centidegrees: int  # Temperature in 0.01C units
@@ -101,9 +106,9 @@ class WriteBuffer:
             return
         try:
             inserted, duplicates = self.database.insert_batch(self.buffer)
-            logger.debug(f"WriteBuffer flushed: {inserted} inserted, {duplicates} duplicates")
+            logger.debug("WriteBuffer flushed: %s inserted, %s duplicates", inserted, duplicates)
         except Exception as e:
-            logger.error(f"WriteBuffer flush failed: {e}")
+            logger.error("WriteBuffer flush failed: %s", e)
         self.buffer.clear()
         self.last_flush = time.time()
 
@@ -317,6 +322,31 @@ class SensorDatabase:
         # _open_connection, which re-acquires the same lock. A plain
         # Lock would deadlock the read thread after a connection reset.
         self._conn_lock = threading.RLock()
+        # Write-through caches for the all-nodes lookups embedded in
+        # /api/nodes. Every writer of these tables lives in this process and
+        # goes through the update_*/delete_* methods below, which drop the
+        # affected entry; between writes the dashboard's poll reads hit the
+        # cached dicts instead of re-running three full-table SELECTs.
+        self._all_cache: dict[str, Optional[dict]] = {
+            'metadata': None, 'status': None, 'valves': None, 'zones': None,
+        }
+        self._all_cache_lock = threading.Lock()
+
+    def _cached_all(self, key: str):
+        """Return the cached all-nodes dict for key, or None when stale."""
+        with self._all_cache_lock:
+            return self._all_cache[key]
+
+    def _store_all_cache(self, key: str, value: dict) -> None:
+        """Store a freshly built all-nodes dict."""
+        with self._all_cache_lock:
+            self._all_cache[key] = value
+
+    def _invalidate_all_cache(self, *keys: str) -> None:
+        """Drop cached all-nodes dicts after their tables were written."""
+        with self._all_cache_lock:
+            for key in keys:
+                self._all_cache[key] = None
 
     def _ensure_directory(self):
         """Ensure the database directory exists."""
@@ -400,7 +430,7 @@ class SensorDatabase:
                     conn.execute(statement)
             self._migrate_schema(conn)
             self._init_id_counter(conn)
-            logger.info(f"Database initialized at {self.db_path}")
+            logger.info("Database initialized at %s", self.db_path)
 
     def _migrate_schema(self, conn):
         """Apply schema migrations for existing databases."""
@@ -424,7 +454,7 @@ class SensorDatabase:
                 )
                 logger.info("Migrated irrigation_schedules: added confirmed_at column")
         except Exception as e:
-            logger.warning(f"Schema migration check failed: {e}")
+            logger.warning("Schema migration check failed: %s", e)
 
         # Add valve_count column to nodes if missing
         try:
@@ -436,7 +466,7 @@ class SensorDatabase:
                 conn.execute("ALTER TABLE nodes ADD COLUMN valve_count INTEGER")
                 logger.info("Migrated nodes: added valve_count column")
         except Exception as e:
-            logger.warning(f"Nodes schema migration check failed: {e}")
+            logger.warning("Nodes schema migration check failed: %s", e)
 
         # Widen node_events' UNIQUE constraint to include data_hex — the old
         # constraint (device_id, timestamp, event_code) silently dropped
@@ -469,7 +499,7 @@ class SensorDatabase:
                 )
                 logger.info("Migrated node_events: widened UNIQUE constraint to include data_hex")
         except Exception as e:
-            logger.warning(f"node_events schema migration check failed: {e}")
+            logger.warning("node_events schema migration check failed: %s", e)
 
         # Widen node_events.timestamp from INTEGER (unix seconds) to BIGINT
         # (unix milliseconds) — firmware/hub now send millisecond-precision
@@ -508,7 +538,7 @@ class SensorDatabase:
                     "(existing rows scaled x1000)"
                 )
         except Exception as e:
-            logger.warning(f"node_events timestamp migration check failed: {e}")
+            logger.warning("node_events timestamp migration check failed: %s", e)
 
     def close(self):
         """Close the persistent database connection."""
@@ -570,7 +600,7 @@ class SensorDatabase:
                 return False
 
         except duckdb.Error as e:
-            logger.error(f"Failed to insert reading: {e}")
+            logger.error("Failed to insert reading: %s", e)
             return False
 
     def insert_batch(self, readings: list[SensorReading]) -> tuple[int, int]:
@@ -624,11 +654,11 @@ class SensorDatabase:
                     else:
                         duplicates += 1
 
-                logger.info(f"Batch insert: {inserted} inserted, {duplicates} duplicates")
+                logger.info("Batch insert: %s inserted, %s duplicates", inserted, duplicates)
                 return (inserted, duplicates)
 
         except duckdb.Error as e:
-            logger.error(f"Batch insert failed: {e}")
+            logger.error("Batch insert failed: %s", e)
             return (0, len(readings))
 
     def _update_node_stats(self, conn: duckdb.DuckDBPyConnection, device_id: int, address: Optional[int], timestamp: int):
@@ -662,6 +692,28 @@ class SensorDatabase:
                 VALUES (?, ?, 'SENSOR', ?, ?, 1)
             """, (device_id, address, timestamp, timestamp))
 
+    @staticmethod
+    def _readings_where(
+        device_id: Optional[int],
+        start_time: Optional[int],
+        end_time: Optional[int]
+    ) -> tuple[str, list]:
+        """Build the shared WHERE clause + params for sensor_readings queries."""
+        conditions = []
+        params = []
+
+        if device_id is not None:
+            conditions.append("device_id = ?")
+            params.append(device_id)
+        if start_time is not None:
+            conditions.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            conditions.append("timestamp <= ?")
+            params.append(end_time)
+
+        return " AND ".join(conditions) if conditions else "1=1", params
+
     def query_readings(
         self,
         device_id: Optional[int] = None,
@@ -682,20 +734,7 @@ class SensorDatabase:
         Returns:
             List of SensorReading objects
         """
-        conditions = []
-        params = []
-
-        if device_id is not None:
-            conditions.append("device_id = ?")
-            params.append(device_id)
-        if start_time is not None:
-            conditions.append("timestamp >= ?")
-            params.append(start_time)
-        if end_time is not None:
-            conditions.append("timestamp <= ?")
-            params.append(end_time)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._readings_where(device_id, start_time, end_time)
         params.extend([limit, offset])
 
         with self._get_connection() as conn:
@@ -721,6 +760,106 @@ class SensorDatabase:
                 for row in result.fetchall()
             ]
 
+    def query_reading_dicts(
+        self,
+        device_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 1000,
+        offset: int = 0,
+        before: Optional[tuple[int, int]] = None
+    ) -> tuple[list[dict], Optional[tuple[int, int]]]:
+        """Query readings as JSON-ready dicts (SensorReading.to_dict() shape).
+
+        The sensor-data endpoints serialize these straight to JSON; building
+        the dicts directly from the result rows skips a SensorReading object,
+        a to_dict() call, and two property evaluations per row — which at
+        limit=10000 was most of the endpoint's CPU.
+
+        Args:
+            before: Optional (timestamp, id) keyset cursor. When given, only
+                rows strictly before that position in the DESC ordering are
+                returned and offset is ignored. Paging by cursor costs
+                O(limit) at any depth, where OFFSET re-scans everything it
+                skips.
+
+        Returns:
+            (readings, next_cursor) — next_cursor is the (timestamp, id) of
+            the last row when the page is full (more rows may follow), else
+            None.
+        """
+        where_clause, params = self._readings_where(device_id, start_time, end_time)
+        if before is not None:
+            # id breaks ties between readings sharing a timestamp, so the
+            # cursor never skips or repeats rows at page boundaries.
+            where_clause += " AND (timestamp, id) < (?, ?)"
+            params.extend(before)
+            offset = 0
+        params.extend([limit, offset])
+
+        with self._get_connection() as conn:
+            rows = conn.execute(f"""
+                SELECT device_id, address, timestamp, temperature_centidegrees,
+                       humidity_centipercent, flags, received_at, id
+                FROM sensor_readings
+                WHERE {where_clause}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, params).fetchall()
+
+        readings = [
+            {
+                'device_id': str(row[0]),  # String to preserve JS precision
+                'address': row[1],
+                'timestamp': row[2],
+                'temperature_celsius': row[3] / 100.0,
+                'humidity_percent': row[4] / 100.0,
+                'temperature_raw': row[3],
+                'humidity_raw': row[4],
+                'flags': row[5],
+                'received_at': row[6],
+            }
+            for row in rows
+        ]
+        next_cursor = (rows[-1][2], rows[-1][7]) if len(rows) == limit else None
+        return readings, next_cursor
+
+    def query_chart_dicts(
+        self,
+        device_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 1000
+    ) -> list[dict]:
+        """Query readings as compact chart dicts (to_chart_dict() shape).
+
+        Same shortcut as query_reading_dicts for the chart endpoint: dicts
+        come straight from the result rows with no dataclass round-trip.
+        """
+        where_clause, params = self._readings_where(device_id, start_time, end_time)
+        params.append(limit)
+
+        with self._get_connection() as conn:
+            rows = conn.execute(f"""
+                SELECT timestamp, temperature_centidegrees, humidity_centipercent, flags
+                FROM sensor_readings
+                WHERE {where_clause}
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, params).fetchall()
+
+        results = []
+        for timestamp, temperature, humidity, flags in rows:
+            entry = {
+                'timestamp': timestamp,
+                'temperature_celsius': temperature / 100.0,
+                'humidity_percent': humidity / 100.0,
+            }
+            if flags:
+                entry['flags'] = flags
+            results.append(entry)
+        return results
+
     def get_latest_reading(self, device_id: int) -> Optional[SensorReading]:
         """Get the most recent reading for a node.
 
@@ -883,20 +1022,22 @@ class SensorDatabase:
         Returns:
             Count of matching readings
         """
-        conditions = []
-        params = []
-
-        if device_id is not None:
-            conditions.append("device_id = ?")
-            params.append(device_id)
-        if start_time is not None:
-            conditions.append("timestamp >= ?")
-            params.append(start_time)
-        if end_time is not None:
-            conditions.append("timestamp <= ?")
-            params.append(end_time)
+        # Unfiltered counts come from the running total_readings counters the
+        # insert path maintains on nodes — O(#nodes) instead of scanning the
+        # readings table, which pagination metadata otherwise does per page.
+        if start_time is None and end_time is None:
+            with self._get_connection() as conn:
+                if device_id is not None:
+                    row = conn.execute(
+                        "SELECT total_readings FROM nodes WHERE device_id = ?",
+                        (device_id,)
+                    ).fetchone()
+                    return row[0] if row else 0
+                return conn.execute(
+                    "SELECT COALESCE(SUM(total_readings), 0) FROM nodes"
+                ).fetchone()[0]
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._readings_where(device_id, start_time, end_time)
 
         with self._get_connection() as conn:
             result = conn.execute(f"""
@@ -910,10 +1051,12 @@ class SensorDatabase:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None
     ):
-        """Export readings as a CSV line generator (streaming).
+        """Export readings as a streaming CSV generator.
 
-        Yields one row at a time instead of building the full result
-        in memory, keeping memory usage constant regardless of data size.
+        Yields the header, then chunks of ~1000 rows at a time: memory stays
+        O(chunk) regardless of export size, while each yield is big enough
+        that the WSGI layer and gzip compression aren't fed one tiny string
+        per row.
 
         Args:
             device_id: Filter by device ID (optional)
@@ -921,24 +1064,11 @@ class SensorDatabase:
             end_time: End timestamp (optional)
 
         Yields:
-            CSV lines including header
+            CSV text chunks including header
         """
         yield "device_id,address,timestamp,temperature_celsius,humidity_percent,flags\n"
 
-        conditions = []
-        params = []
-
-        if device_id is not None:
-            conditions.append("device_id = ?")
-            params.append(device_id)
-        if start_time is not None:
-            conditions.append("timestamp >= ?")
-            params.append(start_time)
-        if end_time is not None:
-            conditions.append("timestamp <= ?")
-            params.append(end_time)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._readings_where(device_id, start_time, end_time)
 
         with self._get_connection() as conn:
             result = conn.execute(f"""
@@ -950,12 +1080,14 @@ class SensorDatabase:
             """, params)
 
             while True:
-                row = result.fetchone()
-                if row is None:
+                rows = result.fetchmany(1000)
+                if not rows:
                     break
-                temp_c = row[3] / 100.0
-                hum_p = row[4] / 100.0
-                yield f"{row[0]},{row[1] or ''},{row[2]},{temp_c:.2f},{hum_p:.2f},{row[5]}\n"
+                yield ''.join(
+                    f"{row[0]},{row[1] or ''},{row[2]},"
+                    f"{row[3] / 100.0:.2f},{row[4] / 100.0:.2f},{row[5]}\n"
+                    for row in rows
+                )
 
     def get_node_metadata(self, device_id: int) -> Optional[dict]:
         """Get metadata for a node.
@@ -990,6 +1122,10 @@ class SensorDatabase:
         Returns:
             Dictionary mapping device_id to metadata dict
         """
+        cached = self._cached_all('metadata')
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
             result = conn.execute("""
                 SELECT device_id, name, notes, zone_id, updated_at
@@ -1005,7 +1141,9 @@ class SensorDatabase:
                     'zone_id': row[3],
                     'updated_at': row[4]
                 }
-            return metadata
+
+        self._store_all_cache('metadata', metadata)
+        return metadata
 
     def update_node_metadata(
         self,
@@ -1059,6 +1197,7 @@ class SensorDatabase:
                     VALUES (?, ?, ?, ?, ?)
                 """, (device_id, name, notes, actual_zone_id, updated_at))
 
+        self._invalidate_all_cache('metadata')
         return self.get_node_metadata(device_id)
 
     def get_valve_metadata(self, device_id: int, valve_index: int) -> Optional[dict]:
@@ -1094,6 +1233,10 @@ class SensorDatabase:
             Nested dict: {device_id: {valve_index: metadata_dict}}. Used to
             embed valve names in the /api/nodes response without a query per node.
         """
+        cached = self._cached_all('valves')
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
             rows = conn.execute("""
                 SELECT device_id, valve_index, name, updated_at
@@ -1108,6 +1251,7 @@ class SensorDatabase:
                 'name': row[2],
                 'updated_at': row[3],
             }
+        self._store_all_cache('valves', result)
         return result
 
     def update_valve_metadata(
@@ -1147,6 +1291,7 @@ class SensorDatabase:
                     VALUES (?, ?, ?, ?)
                 """, (device_id, valve_index, name, updated_at))
 
+        self._invalidate_all_cache('valves')
         return self.get_valve_metadata(device_id, valve_index)
 
     def sync_to_s3(
@@ -1179,11 +1324,11 @@ class SensorDatabase:
                 s3_path = f"s3://{bucket}/{prefix}sensor_readings.parquet"
                 conn.execute(f"COPY sensor_readings TO '{s3_path}' (FORMAT PARQUET)")
 
-                logger.info(f"Synced database to {s3_path}")
+                logger.info("Synced database to %s", s3_path)
                 return True
 
         except Exception as e:
-            logger.warning(f"S3 sync failed (non-fatal): {e}")
+            logger.warning("S3 sync failed (non-fatal): %s", e)
             return False
 
     # ===== Zone Management =====
@@ -1209,7 +1354,8 @@ class SensorDatabase:
                 VALUES (?, ?, ?, ?)
             """, (next_id, name, color, description))
 
-            return self.get_zone(next_id)
+        self._invalidate_all_cache('zones')
+        return self.get_zone(next_id)
 
     def get_zone(self, zone_id: int) -> Optional[dict]:
         """Get a zone by ID.
@@ -1220,44 +1366,44 @@ class SensorDatabase:
         Returns:
             Zone dictionary or None if not found
         """
-        with self._get_connection() as conn:
-            result = conn.execute("""
-                SELECT id, name, color, description
-                FROM zones WHERE id = ?
-            """, (zone_id,))
-            row = result.fetchone()
-
-            if not row:
-                return None
-
-            return {
-                'id': row[0],
-                'name': row[1],
-                'color': row[2],
-                'description': row[3]
-            }
+        return self._zones_by_id().get(zone_id)
 
     def get_all_zones(self) -> list[dict]:
-        """Get all zones.
+        """Get all zones, ordered by name.
 
         Returns:
             List of zone dictionaries
         """
+        return list(self._zones_by_id().values())
+
+    def _zones_by_id(self) -> dict[int, dict]:
+        """All zones keyed by id, in name order, via the write-through cache.
+
+        Zones are near-static but read on every zone endpoint hit and chart
+        color lookup; the handful of rows fit the same cache the all-nodes
+        lookups use, invalidated by the zone writers below.
+        """
+        cached = self._cached_all('zones')
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
             result = conn.execute("""
                 SELECT id, name, color, description
                 FROM zones ORDER BY name
             """)
-
-            return [
-                {
+            zones = {
+                row[0]: {
                     'id': row[0],
                     'name': row[1],
                     'color': row[2],
                     'description': row[3]
                 }
                 for row in result.fetchall()
-            ]
+            }
+
+        self._store_all_cache('zones', zones)
+        return zones
 
     def update_zone(
         self,
@@ -1296,6 +1442,7 @@ class SensorDatabase:
                 WHERE id = ?
             """, (current_name, current_color, current_description, zone_id))
 
+        self._invalidate_all_cache('zones')
         return self.get_zone(zone_id)
 
     def delete_zone(self, zone_id: int) -> bool:
@@ -1327,7 +1474,8 @@ class SensorDatabase:
             # Delete the zone
             conn.execute("DELETE FROM zones WHERE id = ?", (zone_id,))
 
-            return True
+        self._invalidate_all_cache('metadata', 'zones')
+        return True
 
     # --- Valve groups (master valve) ---
 
@@ -1496,15 +1644,23 @@ class SensorDatabase:
                       slot['minute'], slot['duration'], slot['days']))
 
     def set_node_zone(self, device_id: int, zone_id: Optional[int]) -> Optional[dict]:
-        """Set a node's zone.
+        """Set a node's zone, validating the zone in the same call.
 
         Args:
             device_id: Device ID
             zone_id: Zone ID or None to unzone
 
         Returns:
-            Updated node metadata or None if node not found
+            Updated node metadata, or None if the zone does not exist
         """
+        if zone_id is not None:
+            with self._get_connection() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM zones WHERE id = ?", (zone_id,)
+                ).fetchone()
+            if not exists:
+                return None
+
         # Use -1 to explicitly unset zone_id in update_node_metadata
         zone_value = -1 if zone_id is None else zone_id
         return self.update_node_metadata(device_id, zone_id=zone_value)
@@ -1581,6 +1737,7 @@ class SensorDatabase:
                     conn, device_id, error_flags, battery_level, signal_strength, uptime_seconds, pending_records, updated_at
                 )
 
+        self._invalidate_all_cache('status')
         return self.get_node_status(device_id)
 
     def _record_status_history(
@@ -1642,6 +1799,10 @@ class SensorDatabase:
         Returns:
             Dictionary mapping device_id to status dict
         """
+        cached = self._cached_all('status')
+        if cached is not None:
+            return cached
+
         with self._get_connection() as conn:
             result = conn.execute("""
                 SELECT device_id, address, battery_level, error_flags,
@@ -1661,7 +1822,21 @@ class SensorDatabase:
                     'pending_records': row[6],
                     'updated_at': row[7]
                 }
-            return status
+
+        self._store_all_cache('status', status)
+        return status
+
+    def get_node_types(self) -> dict[int, str]:
+        """Get the node_type for every registered node in one query.
+
+        Returns:
+            Dictionary mapping device_id to node type string. Used by the
+            /api/nodes database fallback, since node_status does not store
+            the type.
+        """
+        with self._get_connection() as conn:
+            result = conn.execute("SELECT device_id, node_type FROM nodes")
+            return {row[0]: row[1] for row in result.fetchall()}
 
     def get_node_error_history(
         self,
@@ -1733,25 +1908,35 @@ class SensorDatabase:
             if not exists:
                 return False
 
-            # Delete from all related tables
-            conn.execute("DELETE FROM sensor_readings WHERE device_id = ?", (device_id,))
-            conn.execute("DELETE FROM node_status_history WHERE device_id = ?", (device_id,))
-            conn.execute("DELETE FROM node_status WHERE device_id = ?", (device_id,))
-            conn.execute("DELETE FROM node_metadata WHERE device_id = ?", (device_id,))
-            conn.execute("DELETE FROM irrigation_schedules WHERE device_id = ?", (device_id,))
-            # Valve groups: drop this node's zone memberships, and any group it
-            # was the master of (plus that group's members and owned slots).
-            conn.execute("DELETE FROM valve_group_members WHERE zone_device_id = ?", (device_id,))
-            conn.execute(
-                "DELETE FROM valve_group_members WHERE group_id IN "
-                "(SELECT id FROM valve_groups WHERE master_device_id = ?)", (device_id,))
-            conn.execute(
-                "DELETE FROM valve_group_master_slots WHERE master_device_id = ?", (device_id,))
-            conn.execute("DELETE FROM valve_groups WHERE master_device_id = ?", (device_id,))
-            conn.execute("DELETE FROM nodes WHERE device_id = ?", (device_id,))
+            # Delete from all related tables in one transaction: the node is
+            # either fully gone or untouched, and the deletes commit with a
+            # single WAL flush instead of one per statement.
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute("DELETE FROM sensor_readings WHERE device_id = ?", (device_id,))
+                conn.execute("DELETE FROM node_status_history WHERE device_id = ?", (device_id,))
+                conn.execute("DELETE FROM node_status WHERE device_id = ?", (device_id,))
+                conn.execute("DELETE FROM node_metadata WHERE device_id = ?", (device_id,))
+                conn.execute("DELETE FROM irrigation_schedules WHERE device_id = ?", (device_id,))
+                # Valve groups: drop this node's zone memberships, and any group it
+                # was the master of (plus that group's members and owned slots).
+                conn.execute("DELETE FROM valve_group_members WHERE zone_device_id = ?", (device_id,))
+                conn.execute(
+                    "DELETE FROM valve_group_members WHERE group_id IN "
+                    "(SELECT id FROM valve_groups WHERE master_device_id = ?)", (device_id,))
+                conn.execute(
+                    "DELETE FROM valve_group_master_slots WHERE master_device_id = ?", (device_id,))
+                conn.execute("DELETE FROM valve_groups WHERE master_device_id = ?", (device_id,))
+                conn.execute("DELETE FROM nodes WHERE device_id = ?", (device_id,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
 
-            logger.info(f"Deleted node with device_id {device_id} and all associated data")
-            return True
+            logger.info("Deleted node with device_id %s and all associated data", device_id)
+
+        self._invalidate_all_cache('metadata', 'status', 'valves')
+        return True
 
     def get_node_by_device_id(self, device_id: int) -> Optional[dict]:
         """Get node info by device_id.
@@ -1845,7 +2030,7 @@ class SensorDatabase:
                 return count > 0
 
         except duckdb.Error as e:
-            logger.error(f"Failed to insert event: {e}")
+            logger.error("Failed to insert event: %s", e)
             return False
 
     def query_events(self, device_id: int, start_time: int = None,
@@ -1901,7 +2086,7 @@ class SensorDatabase:
                 } for row in rows]
 
         except duckdb.Error as e:
-            logger.error(f"Failed to query events: {e}")
+            logger.error("Failed to query events: %s", e)
             return []
 
     # ------------------------------------------------------------------
@@ -1937,7 +2122,7 @@ class SensorDatabase:
                       now, now + ttl_seconds, huey_task_id))
                 return new_id
         except duckdb.Error as e:
-            logger.error(f"Failed to insert command: {e}")
+            logger.error("Failed to insert command: %s", e)
             return None
 
     def set_command_huey_task(self, command_id: int, huey_task_id: str) -> bool:
@@ -1950,7 +2135,7 @@ class SensorDatabase:
                 )
             return True
         except duckdb.Error as e:
-            logger.error(f"Failed to set huey_task_id on command {command_id}: {e}")
+            logger.error("Failed to set huey_task_id on command %s: %s", command_id, e)
             return False
 
     def find_pending_command(self, device_id: int, command_type: str,
@@ -1998,7 +2183,7 @@ class SensorDatabase:
                     }
             return None
         except duckdb.Error as e:
-            logger.error(f"Failed to find pending command: {e}")
+            logger.error("Failed to find pending command: %s", e)
             return None
 
     def update_command_status(self, command_id: int, status: str,
@@ -2027,7 +2212,7 @@ class SensorDatabase:
                 """, (status, ts, event_code, event_detail, command_id))
             return True
         except duckdb.Error as e:
-            logger.error(f"Failed to update command {command_id}: {e}")
+            logger.error("Failed to update command %s: %s", command_id, e)
             return False
 
     def query_commands(self, device_id: int,
@@ -2089,7 +2274,7 @@ class SensorDatabase:
                     })
                 return out
         except duckdb.Error as e:
-            logger.error(f"Failed to query commands: {e}")
+            logger.error("Failed to query commands: %s", e)
             return []
 
     def expire_stale_commands(self, now: Optional[int] = None) -> int:
@@ -2115,7 +2300,7 @@ class SensorDatabase:
                 """, (ts,)).fetchone()
                 return int(result[0]) if result else 0
         except duckdb.Error as e:
-            logger.error(f"Failed to expire stale commands: {e}")
+            logger.error("Failed to expire stale commands: %s", e)
             return 0
 
     def store_schedule(self, device_id: int, index: int, hour: int, minute: int,
@@ -2149,7 +2334,7 @@ class SensorDatabase:
                       hour, minute, duration, days, valve, now))
                 return True
         except duckdb.Error as e:
-            logger.error(f"Failed to store schedule: {e}")
+            logger.error("Failed to store schedule: %s", e)
             return False
 
     def get_schedules(self, device_id: int) -> list[dict]:
@@ -2183,7 +2368,7 @@ class SensorDatabase:
                     'confirmed_at': row[8],
                 } for row in rows]
         except duckdb.Error as e:
-            logger.error(f"Failed to get schedules: {e}")
+            logger.error("Failed to get schedules: %s", e)
             return []
 
     def delete_schedule(self, device_id: int, index: int) -> bool:
@@ -2204,7 +2389,7 @@ class SensorDatabase:
                 """, (device_id, index))
                 return True
         except duckdb.Error as e:
-            logger.error(f"Failed to delete schedule: {e}")
+            logger.error("Failed to delete schedule: %s", e)
             return False
 
     def confirm_schedule(self, device_id: int, schedule_index: int,
@@ -2228,7 +2413,7 @@ class SensorDatabase:
                 """, (timestamp, device_id, schedule_index))
                 return True
         except duckdb.Error as e:
-            logger.error(f"Failed to confirm schedule: {e}")
+            logger.error("Failed to confirm schedule: %s", e)
             return False
 
     def confirm_schedule_removed(self, device_id: int, schedule_index: int,
@@ -2251,7 +2436,7 @@ class SensorDatabase:
                 """, (device_id, schedule_index))
                 return True
         except duckdb.Error as e:
-            logger.error(f"Failed to confirm schedule removal: {e}")
+            logger.error("Failed to confirm schedule removal: %s", e)
             return False
 
     def fail_schedule(self, device_id: int, schedule_index: int,
@@ -2275,5 +2460,5 @@ class SensorDatabase:
                 """, (timestamp, device_id, schedule_index))
                 return True
         except duckdb.Error as e:
-            logger.error(f"Failed to mark schedule as failed: {e}")
+            logger.error("Failed to mark schedule as failed: %s", e)
             return False
@@ -0,0 +1,29 @@
+"""Gunicorn configuration for the Bramble API.
+
+Single worker because the serial port (and its background read thread) is a
+process-wide singleton — a second worker would open the port twice and steal
+bytes. Request concurrency comes from threads instead: handlers spend most of
+their time blocked on hub round-trips, so threads overlap serial waits rather
+than competing for CPU. SerialInterface.send_command serializes hub access
+internally via its command lock.
+"""
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}"
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+timeout = 60
+
+
+def post_fork(server, worker):
+    """Connect to the hub as soon as the worker starts, not on first request.
+
+    The hub streams GET_DATETIME queries continuously; connecting up front means
+    they are answered immediately after a restart.
+    """
+    import app
+    try:
+        app.connect_serial_at_startup()
+    except Exception as e:
+        server.log.warning(f"Serial connect deferred to first request: {e}")
@@ -1,5 +1,6 @@
 """Data models for Bramble API."""
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 # Number of on-node schedule slots (must match the PMU firmware constant
@@ -9,11 +10,16 @@ from typing import Optional
 MAX_SCHEDULE_SLOTS = 100
 
 
+@lru_cache(maxsize=128)
 def format_firmware_version(raw_version: int) -> str:
     """Format a raw uint32 firmware version as a human-readable string.
 
     Encoding: (major << 24) | (minor << 16) | build
     Example: 0x01000000 -> "1.0.0", 0x01010005 -> "1.1.5"
+
+    Memoized: the fleet runs a handful of distinct versions and the same
+    integer always maps to the same string, but list_nodes formats one per
+    node on every dashboard poll.
     """
     major = (raw_version >> 24) & 0xFF
     minor = (raw_version >> 16) & 0xFF
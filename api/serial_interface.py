@@ -1,4 +1,5 @@
 """Serial interface for communicating with LoRa hub."""
+import re
 import serial
 import threading
 import time
@@ -55,7 +56,17 @@ class SerialInterface:
                 self.baud,
                 timeout=Config.SERIAL_TIMEOUT
             )
-            logger.info(f"Connected to hub on {self.port} at {self.baud} baud")
+            logger.info("Connected to hub on %s at %s baud", self.port, self.baud)
+
+            # Ask the kernel to deliver bytes immediately instead of batching
+            # them on the driver's read timer (16ms on FTDI-style USB-serial).
+            # That timer puts a latency floor under every hub round-trip. Not
+            # all drivers support the ioctl (CDC-ACM ignores it) — best effort.
+            try:
+                self.serial.set_low_latency_mode(True)
+                logger.info("Serial low-latency mode enabled")
+            except (ValueError, NotImplementedError) as e:
+                logger.debug("Low-latency mode not supported on %s: %s", self.port, e)
 
             # Start read thread
             self.running = True
@@ -63,7 +74,7 @@ class SerialInterface:
             self.read_thread.start()
 
         except serial.SerialException as e:
-            logger.error(f"Failed to connect to serial port: {e}")
+            logger.error("Failed to connect to serial port: %s", e)
             raise
 
     def disconnect(self):
@@ -81,19 +92,19 @@ class SerialInterface:
             try:
                 self._read_until_disconnected()
             except Exception as e:
-                logger.error(f"Read loop error: {e}")
+                logger.error("Read loop error: %s", e)
 
             if not self.running:
                 break
 
             # Reconnect loop
-            logger.warning(f"Serial connection lost, will retry every 5s")
+            logger.warning("Serial connection lost, will retry every 5s")
             while self.running:
                 try:
                     if self.serial and self.serial.is_open:
                         self.serial.close()
                     self.serial = serial.Serial(self.port, self.baud, timeout=Config.SERIAL_TIMEOUT)
-                    logger.info(f"Reconnected to hub on {self.port}")
+                    logger.info("Reconnected to hub on %s", self.port)
                     break
                 except serial.SerialException:
                     time.sleep(5)
@@ -120,21 +131,26 @@ class SerialInterface:
                     time.sleep(0.01)  # Avoid busy loop
 
             except serial.SerialException as e:
-                logger.warning(f"Serial disconnected: {e}")
+                logger.warning("Serial disconnected: %s", e)
                 return
             except Exception as e:
-                logger.error(f"Error reading serial: {e}")
+                logger.error("Error reading serial: %s", e)
                 time.sleep(0.1)
 
     # Known message prefixes that should start a line
     MESSAGE_PREFIXES = [
         "HEARTBEAT ", "SENSOR_BATCH ", "SENSOR_RECORD ",
         "BATCH_COMPLETE ", "SENSOR_DATA ", "HUB_READY",
-        "NODE_LIST ", "NODE ", "GET_DATETIME", "QUEUE ",
+        "NODE_LIST ", "NODE ", "GET_DATETIME", "QUEUES ", "QUEUE ",
         "QUEUED ", "ERROR ", "DELETED_NODE ", "BATCH_ACK_SENT ",
         "EVENT_LOG ", "EVENT ",
     ]
 
+    # Single compiled alternation over MESSAGE_PREFIXES, so the embedded-message
+    # check is one scan of the line instead of one find() per prefix. Every line
+    # from the hub passes through this check, so the per-line cost matters.
+    _EMBEDDED_PREFIX_RE = re.compile('|'.join(re.escape(p) for p in MESSAGE_PREFIXES))
+
     def link_status(self) -> dict:
         """Report serial link liveness for fail-loud health checks.
 
@@ -165,20 +181,19 @@ class SerialInterface:
         """
         # Any line from the hub proves the link is alive (liveness signal).
         self.last_hub_rx_time = time.time()
-        logger.debug(f"Hub: {line}")
+        logger.debug("Hub: %s", line)
 
         # Check if line contains an embedded message (corruption recovery).
         # If UART corruption merges two messages on one line, split them so
         # the embedded message is still processed.
-        for prefix in self.MESSAGE_PREFIXES:
-            idx = line.find(prefix, 1)  # Skip pos 0 (that's the normal start)
-            if idx > 0:
-                logger.warning(f"Detected embedded message at pos {idx}, splitting: {line[:60]}...")
-                self._handle_line(line[idx:])  # Process the embedded message first
-                line = line[:idx].rstrip()
-                if not line:
-                    return
-                break
+        embedded = self._EMBEDDED_PREFIX_RE.search(line, 1)  # Skip pos 0 (normal start)
+        if embedded:
+            idx = embedded.start()
+            logger.warning("Detected embedded message at pos %s, splitting: %s...", idx, line[:60])
+            self._handle_line(line[idx:])  # Process the embedded message first
+            line = line[:idx].rstrip()
+            if not line:
+                return
 
         # Proactively send time when hub signals it's ready
         # This ensures hub gets time regardless of boot order
@@ -226,11 +241,11 @@ class SerialInterface:
 
         # Handle batch acknowledgment confirmations from hub
         if line.startswith("BATCH_ACK_SENT "):
-            logger.debug(f"Batch ACK confirmed: {line}")
+            logger.debug("Batch ACK confirmed: %s", line)
             return
 
         # Otherwise, it's a response to our command
-        logger.info(f"Response queued: {line}")
+        logger.info("Response queued: %s", line)
         self.response_queue.put(line)
 
     def _handle_datetime_query(self):
@@ -253,9 +268,9 @@ class SerialInterface:
             with self.write_lock:
                 self.serial.write(response.encode('utf-8'))
                 self.serial.flush()
-            logger.info(f"Responded to datetime query: {response.strip()}")
+            logger.info("Responded to datetime query: %s", response.strip())
         except Exception as e:
-            logger.error(f"Failed to send datetime response: {e}")
+            logger.error("Failed to send datetime response: %s", e)
 
     def _handle_heartbeat(self, line: str):
         """Handle heartbeat status from hub.
@@ -269,7 +284,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 7:
-                logger.error(f"Invalid HEARTBEAT format: {line}")
+                logger.error("Invalid HEARTBEAT format: %s", line)
                 return
 
             node_addr = int(parts[1])
@@ -282,7 +297,7 @@ class SerialInterface:
             pending_records = int(parts[7]) if len(parts) > 7 else None
 
             if device_id == 0:
-                logger.warning(f"Heartbeat from node {node_addr} has no device_id, skipping")
+                logger.warning("Heartbeat from node %s has no device_id, skipping", node_addr)
                 return
 
             # Store in database using device_id as primary key
@@ -297,11 +312,13 @@ class SerialInterface:
             )
 
             pending_str = f", pending={pending_records}" if pending_records is not None else ""
-            logger.info(f"Updated node status: device_id={device_id}, addr={node_addr}, battery={battery_level}, "
-                       f"errors=0x{error_flags:02X}, rssi={signal_strength}dBm, uptime={uptime_seconds}s{pending_str}")
+            logger.info("Updated node status: device_id=%s, addr=%s, battery=%s, "
+                        "errors=0x%02X, rssi=%sdBm, uptime=%ss%s",
+                        device_id, node_addr, battery_level, error_flags,
+                        signal_strength, uptime_seconds, pending_str)
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse HEARTBEAT: {e}")
+            logger.error("Failed to parse HEARTBEAT: %s", e)
 
     def send_command(self, command: str, timeout: float = Config.COMMAND_TIMEOUT) -> list[str]:
         """Send command to hub and wait for response.
@@ -334,9 +351,9 @@ class SerialInterface:
                 with self.write_lock:
                     self.serial.write(cmd_line.encode('utf-8'))
                     self.serial.flush()
-                logger.info(f"Sent command: {command}")
+                logger.info("Sent command: %s", command)
             except Exception as e:
-                logger.error(f"Failed to send command: {e}")
+                logger.error("Failed to send command: %s", e)
                 raise RuntimeError(f"Failed to send command: {e}")
 
             # Collect response lines
@@ -402,6 +419,13 @@ class SerialInterface:
                 node_count = len([r for r in responses[1:] if r.startswith('NODE ')])
                 return node_count >= expected_count
 
+        if command == 'GET_QUEUES':
+            # Format: QUEUES <count> followed by one QUEUE <addr> <count> per node
+            if responses[0].startswith('QUEUES'):
+                expected_count = int(responses[0].split()[1])
+                queue_count = len([r for r in responses[1:] if r.startswith('QUEUE ')])
+                return queue_count >= expected_count
+
         if command.startswith('GET_QUEUE'):
             # Format: QUEUE <addr> <count> followed by UPDATE lines
             if len(responses) == 1 and responses[0].startswith('QUEUE'):
@@ -430,7 +454,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 5:
-                logger.error(f"Invalid SENSOR_DATA format: {line}")
+                logger.error("Invalid SENSOR_DATA format: %s", line)
                 return
 
             node_addr = int(parts[1])
@@ -440,7 +464,7 @@ class SerialInterface:
             timestamp = int(time.time())
 
             if device_id == 0:
-                logger.warning(f"Sensor data from node {node_addr} has no device_id, skipping")
+                logger.warning("Sensor data from node %s has no device_id, skipping", node_addr)
                 return
 
             # For individual readings, we only have one value at a time
@@ -464,16 +488,16 @@ class SerialInterface:
                     received_at=timestamp
                 )
             else:
-                logger.warning(f"Unknown sensor type: {sensor_type}")
+                logger.warning("Unknown sensor type: %s", sensor_type)
                 return
 
             if self.database.insert_reading(reading):
-                logger.info(f"Stored sensor data: device_id={device_id}, addr={node_addr}, {sensor_type}={value}")
+                logger.info("Stored sensor data: device_id=%s, addr=%s, %s=%s", device_id, node_addr, sensor_type, value)
             else:
-                logger.debug(f"Duplicate sensor data: device_id={device_id}, addr={node_addr}, {sensor_type}={value}")
+                logger.debug("Duplicate sensor data: device_id=%s, addr=%s, %s=%s", device_id, node_addr, sensor_type, value)
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse SENSOR_DATA: {e}")
+            logger.error("Failed to parse SENSOR_DATA: %s", e)
 
     def _handle_event(self, line: str):
         """Handle event notification from hub.
@@ -487,7 +511,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 4:
-                logger.error(f"Invalid EVENT format: {line}")
+                logger.error("Invalid EVENT format: %s", line)
                 return
 
             device_id = int(parts[2])
@@ -501,13 +525,14 @@ class SerialInterface:
             timestamp_ms = timestamp * 1000
 
             if device_id == 0:
-                logger.warning(f"Event from node {parts[1]} has no device_id, skipping")
+                logger.warning("Event from node %s has no device_id, skipping", parts[1])
                 return
 
             if self.database.insert_event(device_id, timestamp_ms, event_code, data_hex):
-                logger.info(f"Stored event: device_id={device_id}, code=0x{event_code:04X}, data={data_hex}")
+                logger.info("Stored event: device_id=%s, code=0x%04X, data=%s",
+                            device_id, event_code, data_hex)
             else:
-                logger.debug(f"Duplicate event: device_id={device_id}, code=0x{event_code:04X}")
+                logger.debug("Duplicate event: device_id=%s, code=0x%04X", device_id, event_code)
 
             # Match pending curtain commands. EVENT_MOTOR_ERROR fails any
             # pending curtain command; the directional/calibration events
@@ -515,7 +540,7 @@ class SerialInterface:
             self._reconcile_curtain_event(device_id, event_code, timestamp)
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse EVENT: {e}")
+            logger.error("Failed to parse EVENT: %s", e)
 
     def _handle_event_log(self, line: str):
         """Handle event log record from hub.
@@ -536,7 +561,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 7:
-                logger.error(f"Invalid EVENT_LOG format: {line}")
+                logger.error("Invalid EVENT_LOG format: %s", line)
                 return
 
             device_id = int(parts[2])
@@ -547,7 +572,7 @@ class SerialInterface:
             detail = int(parts[6])
 
             if device_id == 0:
-                logger.warning(f"Event log from node {parts[1]} has no device_id, skipping")
+                logger.warning("Event log from node %s has no device_id, skipping", parts[1])
                 return
 
             # Store as a node event (event_code = event_type, data_hex = severity:detail)
@@ -564,7 +589,7 @@ class SerialInterface:
             # Handle schedule confirmation events
             if event_type == EventType.SCHEDULE_APPLIED:
                 self.database.confirm_schedule(device_id, schedule_index, unix_ts)
-                logger.info(f"Schedule confirmed: device_id={device_id}, index={schedule_index}")
+                logger.info("Schedule confirmed: device_id=%s, index=%s", device_id, schedule_index)
             elif event_type == EventType.SCHEDULE_REMOVED:
                 self.database.confirm_schedule_removed(device_id, schedule_index, unix_ts)
                 logger.info(
@@ -593,7 +618,7 @@ class SerialInterface:
             )
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse EVENT_LOG: {e}")
+            logger.error("Failed to parse EVENT_LOG: %s", e)
 
     def _reconcile_valve_event(self, device_id: int, event_type: int,
                                valve_id: int, unix_ts: int):
@@ -718,7 +743,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 4:
-                logger.error(f"Invalid SENSOR_BATCH format: {line}")
+                logger.error("Invalid SENSOR_BATCH format: %s", line)
                 return
 
             node_addr = int(parts[1])
@@ -726,7 +751,7 @@ class SerialInterface:
             count = int(parts[3])
 
             if device_id == 0:
-                logger.warning(f"Batch from node {node_addr} has no device_id, skipping")
+                logger.warning("Batch from node %s has no device_id, skipping", node_addr)
                 return
 
             self._batch_state = {
@@ -737,10 +762,10 @@ class SerialInterface:
                 'start_time': time.time()
             }
 
-            logger.info(f"Starting batch receive: device_id={device_id}, addr={node_addr}, expected={count}")
+            logger.info("Starting batch receive: device_id=%s, addr=%s, expected=%s", device_id, node_addr, count)
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse SENSOR_BATCH: {e}")
+            logger.error("Failed to parse SENSOR_BATCH: %s", e)
 
     def _handle_sensor_record(self, line: str):
         """Handle individual record in a batch.
@@ -754,7 +779,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 7:
-                logger.error(f"Invalid SENSOR_RECORD format: {line}")
+                logger.error("Invalid SENSOR_RECORD format: %s", line)
                 return
 
             node_addr = int(parts[1])
@@ -775,10 +800,10 @@ class SerialInterface:
             )
 
             self._batch_state['records'].append(reading)
-            logger.debug(f"Batch record: device_id={device_id}, ts={timestamp}, temp={temperature}, hum={humidity}")
+            logger.debug("Batch record: device_id=%s, ts=%s, temp=%s, hum=%s", device_id, timestamp, temperature, humidity)
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse SENSOR_RECORD: {e}")
+            logger.error("Failed to parse SENSOR_RECORD: %s", e)
 
     def _handle_batch_complete(self, line: str):
         """Handle end of sensor batch.
@@ -792,7 +817,7 @@ class SerialInterface:
         try:
             parts = line.split()
             if len(parts) < 4:
-                logger.error(f"Invalid BATCH_COMPLETE format: {line}")
+                logger.error("Invalid BATCH_COMPLETE format: %s", line)
                 return
 
             node_addr = int(parts[1])
@@ -802,12 +827,12 @@ class SerialInterface:
             # Verify batch integrity
             actual_count = len(self._batch_state['records'])
             if actual_count != count:
-                logger.warning(f"Batch count mismatch: expected={count}, actual={actual_count}")
+                logger.warning("Batch count mismatch: expected=%s, actual=%s", count, actual_count)
 
             # Store batch in database
             if self.database and self._batch_state['records']:
                 inserted, duplicates = self.database.insert_batch(self._batch_state['records'])
-                logger.info(f"Batch stored: inserted={inserted}, duplicates={duplicates}")
+                logger.info("Batch stored: inserted=%s, duplicates=%s", inserted, duplicates)
 
                 # Send acknowledgment to hub
                 # Success (status=0) if any records were processed (inserted OR duplicates)
@@ -821,11 +846,11 @@ class SerialInterface:
 
             # Clear batch state
             elapsed = time.time() - self._batch_state['start_time']
-            logger.info(f"Batch complete: device_id={device_id}, addr={node_addr}, records={actual_count}, elapsed={elapsed:.2f}s")
+            logger.info("Batch complete: device_id=%s, addr=%s, records=%s, elapsed=%.2fs", device_id, node_addr, actual_count, elapsed)
             self._batch_state = None
 
         except (ValueError, IndexError) as e:
-            logger.error(f"Failed to parse BATCH_COMPLETE: {e}")
+            logger.error("Failed to parse BATCH_COMPLETE: %s", e)
             self._batch_state = None
 
     def _send_batch_ack(self, node_addr: int, count: int, status: int):
@@ -845,6 +870,6 @@ class SerialInterface:
             with self.write_lock:
                 self.serial.write(response.encode('utf-8'))
                 self.serial.flush()
-            logger.info(f"Sent BATCH_ACK: node={node_addr}, count={count}, status={status}")
+            logger.info("Sent BATCH_ACK: node=%s, count=%s, status=%s", node_addr, count, status)
         except Exception as e:
-            logger.error(f"Failed to send BATCH_ACK: {e}")
+            logger.error("Failed to send BATCH_ACK: %s", e)
@@ -166,3 +166,46 @@ class TestDatabaseLayer:
 
         readings = temp_db.query_readings(device_id=device_id)
         assert len(readings) == 1
+
+
+class TestBatchEndpoint:
+    """Test /api/batch internal dispatch."""
+
+    def test_batch_dispatches_sub_requests(self, app_client, seeded_db):
+        """Sub-requests run internally and return per-id status/body."""
+        response = app_client.post('/api/batch', json={'requests': [
+            {'id': 'time', 'url': '/api/system/time'},
+            {'id': 'data', 'url': '/api/sensor-data?limit=5'},
+        ]})
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert data['time']['status'] == 200
+        assert 'timestamp' in data['time']['body']
+        assert data['data']['status'] == 200
+        assert data['data']['body']['count'] == 5
+
+    def test_batch_unknown_url_reported_per_request(self, app_client, temp_db):
+        """An unmatched URL fails its sub-request, not the whole batch."""
+        response = app_client.post('/api/batch', json={'requests': [
+            {'id': 'bad', 'url': '/api/does-not-exist'},
+            {'id': 'time', 'url': '/api/system/time'},
+        ]})
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert data['bad']['status'] == 404
+        assert data['time']['status'] == 200
+
+    def test_batch_rejects_non_get(self, app_client, temp_db):
+        """Mutating sub-requests are refused."""
+        response = app_client.post('/api/batch', json={'requests': [
+            {'id': 'nope', 'method': 'POST', 'url': '/api/nodes/1/schedules'},
+        ]})
+        assert response.status_code == 200
+        assert response.get_json()['nope']['status'] == 405
+
+    def test_batch_requires_requests_list(self, app_client, temp_db):
+        """Body without a requests list is a 400."""
+        response = app_client.post('/api/batch', json={'requests': 'nope'})
+        assert response.status_code == 400
@@ -316,6 +316,8 @@ void HubMode::handleSerialCommand(const char *cmd)
         handleListNodes();
     } else if (strncmp(cmd, "GET_QUEUE ", 10) == 0) {
         handleGetQueue(cmd + 10);
+    } else if (strcmp(cmd, "GET_QUEUES") == 0) {
+        handleGetQueues();
     } else if (strncmp(cmd, "SET_SCHEDULE ", 13) == 0) {
         handleSetSchedule(cmd + 13);
     } else if (strncmp(cmd, "REMOVE_SCHEDULE ", 16) == 0) {
@@ -444,6 +446,26 @@ void HubMode::handleGetQueue(const char *args)
     }
 }
 
+void HubMode::handleGetQueues()
+{
+    // Report pending-update counts for every registered node in one
+    // transaction, so the API's include_queue path costs a single serial
+    // round-trip instead of one GET_QUEUE per node.
+    auto addresses = address_manager_->getRegisteredAddresses();
+
+    char response[64];
+    snprintf(response, sizeof(response), "QUEUES %u\n", (unsigned)addresses.size());
+    uartSend(response);
+
+    for (uint16_t addr : addresses) {
+        size_t count = hub_router_->getPendingUpdateCount(addr);
+        snprintf(response, sizeof(response), "QUEUE %u %zu\n", addr, count);
+        uartSend(response);
+    }
+
+    logger.info("GET_QUEUES: responded with %u nodes", (unsigned)addresses.size());
+}
+
 void HubMode::handleSetSchedule(const char *args)
 {
     // Parse: <addr> <index> <hour>:<min> <duration> <days> <valve>
@@ -28,6 +28,7 @@ private:
     void handleSerialCommand(const char *cmd);
     void handleListNodes();
     void handleGetQueue(const char *args);
+    void handleGetQueues();
     void handleSetSchedule(const char *args);
     void handleRemoveSchedule(const char *args);
     void handleSetWakeInterval(const char *args);